@@ -4,6 +4,8 @@ Simple test to verify the refactored structure works correctly.
 This tests the import structure and basic functionality.
 """
 
+import importlib
+import subprocess
 import sys
 from pathlib import Path
 
@@ -82,8 +84,27 @@ def test_api_exports():
             'load_json'
         ]
         
-        for export in expected_exports:
-            assert hasattr(text_kgc_data, export), f"Missing export: {export}"
+        # Importing the package must not load the lazily exported submodules
+        code = (
+            "import sys, text_kgc_data; "
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('text_kgc_data.'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=package_path
+        )
+        loaded = set(result.stdout.split())
+        eager = loaded & set(text_kgc_data._LAZY.values())
+        assert not eager, f"Imported eagerly: {sorted(eager)}"
+        print("✅ Submodules not imported with the package")
+        
+        missing = set(expected_exports) - set(text_kgc_data.__all__)
+        assert not missing, f"Missing exports: {sorted(missing)}"
+        assert set(text_kgc_data._LAZY) == set(text_kgc_data.__all__), "_LAZY and __all__ differ"
+        
+        # Every lazy name must resolve to the object its module defines
+        for name, module_name in text_kgc_data._LAZY.items():
+            module = importlib.import_module(module_name)
+            assert getattr(text_kgc_data, name) is getattr(module, name), f"{name} does not resolve"
         
         print("✅ API exports present")
         return True
@@ -92,6 +113,33 @@ def test_api_exports():
         print(f"❌ API export test error: {e}")
         return False
 
+def test_lazy_dataset_imports():
+    """Test that importing one dataset module doesn't load the others."""
+    print("\nTesting lazy dataset imports...")
+    
+    try:
+        code = (
+            "import sys, text_kgc_data.datasets.wn18rr; "
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('text_kgc_data.datasets.'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=package_path
+        )
+        loaded = result.stdout.split()
+        assert loaded == ["text_kgc_data.datasets.wn18rr"], f"Loaded dataset modules: {loaded}"
+        print("✅ Other dataset modules not imported")
+        
+        import text_kgc_data.datasets as datasets
+        for name in datasets._LAZY:
+            getattr(datasets, name)
+        print("✅ All dataset exports resolve")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Lazy dataset import test error: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("🧪 Testing TextKGCData refactored structure...\n")
@@ -100,6 +148,7 @@ def main():
         test_imports,
         test_function_signatures,
         test_api_exports,
+        test_lazy_dataset_imports,
     ]
     
     passed = 0
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Test the dataset processing commands.
+
+This script runs the process commands on tiny raw datasets written to a
+temporary directory and checks the files they produce.
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from typer.testing import CliRunner
+
+from test_io import run_with_and_without_fast_deps
+from text_kgc_data.cli import app
+from text_kgc_data.io import load_json, load_ndjson_stream, save_json
+
+runner = CliRunner()
+
+MAPPING_FILES = ["entity_id2name.json", "entity_id2description.json", "relation_id2name.json"]
+
+
+def _write_fb15k237(data_dir: Path) -> None:
+    """Write a minimal raw FB15k-237 dataset to data_dir."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "FB15k_mid2name.txt").write_text("/m/01\tObama\n/m/02\tHawaii\n", encoding='utf-8')
+    (data_dir / "FB15k_mid2description.txt").write_text("/m/01\t44th president\n", encoding='utf-8')
+    (data_dir / "relations.dict").write_text("0\t/people/person/place_of_birth\n", encoding='utf-8')
+    for split in ("train", "valid", "test"):
+        (data_dir / f"{split}.txt").write_text("/m/01\t0\t/m/02\n", encoding='utf-8')
+
+
+def _write_wn18rr(data_dir: Path) -> None:
+    """Write a minimal raw WN18RR dataset to data_dir."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "wordnet-mlj12-definitions.txt").write_text(
+        "00001\t__dog_NN_1\ta domestic animal\n00002\t__cat_NN_1\ta small feline\n", encoding='utf-8'
+    )
+    (data_dir / "relations.dict").write_text("0\t_hypernym\n", encoding='utf-8')
+    for split in ("train", "valid", "test"):
+        (data_dir / f"{split}.txt").write_text("00001\t_hypernym\t00002\n", encoding='utf-8')
+
+
+def _invoke(*args) -> None:
+    result = runner.invoke(app, [str(arg) for arg in args])
+    assert result.exit_code == 0, result.output
+
+
+def test_stream_matches_in_memory():
+    """Test that --stream and NDJSON outputs match the in-memory JSON commands."""
+    print("Testing streamed command outputs...")
+
+    names = {"Q1": "Obama", "Q2": "Hawaii"}
+    descriptions = {
+        "Q1": "Barack Obama was the 44th president of the United States",
+        "Q3": "München is the capital of Bavaria",
+        "Q4": "",
+    }
+
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            save_json(names, tmp / "names.json")
+            save_json(descriptions, tmp / "descriptions.json")
+
+            _invoke("fill-missing-entries", tmp / "names.json", tmp / "descriptions.json", tmp / "fill")
+            _invoke("fill-missing-entries", tmp / "names.json", tmp / "descriptions.json", tmp / "fill_stream", "--stream")
+            for name in ("filled_entity_id2name.json", "filled_entity_id2description.json"):
+                assert load_json(tmp / "fill_stream" / name) == load_json(tmp / "fill" / name), name
+
+            truncate = ["truncate-descriptions", tmp / "descriptions.json", "--max-words", "3"]
+            _invoke(*truncate, tmp / "trunc")
+            _invoke(*truncate, tmp / "trunc_stream", "--stream")
+            expected = load_json(tmp / "trunc" / "truncated_entity_id2description.json")
+            assert load_json(tmp / "trunc_stream" / "truncated_entity_id2description.json") == expected
+
+            # Wikidata5M mappings written with --ndjson, then truncated as NDJSON
+            (tmp / "entity.txt").write_text("Q1\tObama\tBarack\nQ2\tHawaii\n", encoding='utf-8')
+            (tmp / "text.txt").write_text(
+                "".join(f"{entity_id}\t{text}\n" for entity_id, text in descriptions.items() if text),
+                encoding='utf-8'
+            )
+            create = ["wikidata5m", "create-entity-text", tmp / "entity.txt", tmp / "text.txt"]
+            _invoke(*create, tmp / "w5m")
+            _invoke(*create, tmp / "w5m_ndjson", "--ndjson")
+            for name in ("entity_id2name", "entity_id2description"):
+                streamed = dict(load_ndjson_stream(tmp / "w5m_ndjson" / f"{name}.ndjson"))
+                assert streamed == load_json(tmp / "w5m" / f"{name}.json"), name
+            assert (tmp / "w5m_ndjson" / "entity_ids.txt").read_bytes() == (tmp / "w5m" / "entity_ids.txt").read_bytes()
+
+            ndjson_descriptions = tmp / "w5m_ndjson" / "entity_id2description.ndjson"
+            _invoke("truncate-descriptions", ndjson_descriptions, "--max-words", "3", tmp / "w5m_trunc")
+            _invoke(
+                "truncate-descriptions", tmp / "w5m" / "entity_id2description.json", "--max-words", "3",
+                tmp / "w5m_trunc_json"
+            )
+            truncated = dict(load_ndjson_stream(tmp / "w5m_trunc" / "truncated_entity_id2description.ndjson"))
+            assert truncated == load_json(tmp / "w5m_trunc_json" / "truncated_entity_id2description.json")
+
+            # NDJSON descriptions filled against names missing some of them
+            _invoke("fill-missing-entries", tmp / "names.json", ndjson_descriptions, tmp / "w5m_fill")
+            _invoke("fill-missing-entries", tmp / "names.json", tmp / "w5m" / "entity_id2description.json", tmp / "w5m_fill_json")
+            filled = dict(load_ndjson_stream(tmp / "w5m_fill" / "filled_entity_id2description.ndjson"))
+            assert filled == load_json(tmp / "w5m_fill_json" / "filled_entity_id2description.json")
+            names_file = "filled_entity_id2name.json"
+            assert load_json(tmp / "w5m_fill" / names_file) == load_json(tmp / "w5m_fill_json" / names_file)
+
+    run_with_and_without_fast_deps(check)
+
+    print("✓ Streamed and NDJSON outputs match the in-memory commands")
+
+
+def test_process_all():
+    """Test that serial and parallel process-all write the per-dataset commands' outputs."""
+    print("Testing process-all...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = Path(tmp) / "raw"
+        _write_fb15k237(raw / "fb15k237")
+        _write_wn18rr(raw / "wn18rr" / "WN18RR")
+
+        result = runner.invoke(app, ["fb15k237", "process", str(raw / "fb15k237"), str(Path(tmp) / "fb")])
+        assert result.exit_code == 0, result.output
+
+        # The default is serial
+        for mode in ([], ["--serial"], ["--parallel"]):
+            out = Path(tmp) / ("all" + "".join(mode))
+            result = runner.invoke(app, ["process-all", str(raw), str(out), "--skip-missing"] + mode)
+            assert result.exit_code == 0, result.output
+            assert "2 processed, 2 skipped" in result.output, result.output
+
+            for name in MAPPING_FILES + ["train.tsv", "valid.tsv", "test.tsv"]:
+                produced = (out / "fb15k237" / name).read_bytes()
+                assert produced == (Path(tmp) / "fb" / name).read_bytes(), f"{mode}: {name} differs"
+            names = json.loads((out / "wn18rr" / "entity_id2name.json").read_text(encoding='utf-8'))
+            assert names == {"00001": "dog", "00002": "cat"}, names
+
+    print("✓ process-all writes every dataset's outputs, serially or in parallel")
+
+
+def test_process_cache():
+    """Test that unchanged inputs reuse the outputs unless they changed or --force is given."""
+    print("Testing process cache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = Path(tmp) / "raw"
+        out = Path(tmp) / "out"
+        _write_fb15k237(raw)
+        command = ["fb15k237", "process", str(raw), str(out)]
+
+        def run(*extra):
+            result = runner.invoke(app, command + list(extra))
+            assert result.exit_code == 0, result.output
+            return "using cached outputs" in result.output
+
+        assert not run(), "First run used the cache"
+        assert run(), "Unchanged inputs were reprocessed"
+
+        # --force reprocesses even when the cache would hit
+        assert not run("--force"), "--force used the cache"
+        assert run()
+
+        # Miss: an input file was touched
+        stat = (raw / "relations.dict").stat()
+        os.utime(raw / "relations.dict", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert not run(), "Touched input used the cache"
+        assert run()
+
+        # Miss: an output was deleted, or rewritten with different contents
+        (out / "relation_id2name.json").unlink()
+        assert not run(), "Deleted output used the cache"
+        assert (out / "relation_id2name.json").exists(), "Deleted output not rebuilt"
+        (out / "entity_id2description.json").write_text("{}", encoding='utf-8')
+        assert not run(), "Rewritten output used the cache"
+
+        # Miss: another output format was requested
+        result = runner.invoke(app, command + ["--output-format", "msgpack"])
+        assert "using cached outputs" not in result.output, result.output
+
+        # Miss: fingerprint written by an older version
+        (out / ".cache_fingerprint.json").write_text(json.dumps({"train.txt": [1, 2]}), encoding='utf-8')
+        assert not run(), "Old-style fingerprint used the cache"
+
+    print("✓ Cache hits and misses detected")
+
+
+def test_process_missing_input():
+    """Test that a missing raw directory is reported as a usage error."""
+    print("Testing missing raw directory...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = runner.invoke(app, ["fb15k237", "process", str(Path(tmp) / "missing"), str(Path(tmp) / "out")])
+
+    assert result.exit_code == 2, result.output
+    assert "raw data directory not found" in result.output, result.output
+    assert not isinstance(result.exception, FileNotFoundError), result.exception
+
+    print("✓ Missing raw directory reported cleanly")
+
+
+def main():
+    """Run all tests."""
+    print("=== Testing Processing Commands ===\n")
+
+    try:
+        test_process_all()
+        test_process_cache()
+        test_process_missing_input()
+        test_stream_matches_in_memory()
+
+        print("\n🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
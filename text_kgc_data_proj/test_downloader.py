@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test the download helpers.
+
+This script serves a file from a local HTTP server that answers range
+requests properly, ignores them, or only honours the first one, and checks
+that every case downloads the same bytes.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from text_kgc_data import downloader
+from text_kgc_data.downloader import download_files
+
+PAYLOAD = bytes(range(256)) * 1000
+
+# Most requests the server saw in flight at once
+_active = 0
+_peak = 0
+_active_lock = threading.Lock()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve PAYLOAD, honouring Range headers according to the request path."""
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.end_headers()
+
+    def do_GET(self):
+        global _active, _peak
+        with _active_lock:
+            _active += 1
+            _peak = max(_peak, _active)
+        try:
+            # Keep requests open long enough to overlap. The request stops
+            # counting before any response is sent, so a client cannot have
+            # released its connection slot while it is still counted.
+            time.sleep(0.01)
+        finally:
+            with _active_lock:
+                _active -= 1
+        self._send_payload()
+
+    def _send_payload(self):
+        ranged = self.headers.get('Range')
+        # /ranges honours every range, /probe-only only the initial 1-byte
+        # probe, and /plain none at all
+        honour = ranged and (self.path == '/ranges' or (self.path == '/probe-only' and ranged == 'bytes=0-0'))
+        if honour:
+            start, end = (int(value) for value in ranged.split('=')[1].split('-'))
+            body = PAYLOAD[start:end + 1]
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(PAYLOAD)}')
+        else:
+            body = PAYLOAD
+            self.send_response(200)
+            # Advertised even where ignored, as some misbehaving servers do
+            self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_download_fallbacks():
+    """Test ranged downloads, the single-stream fallback and the connection cap."""
+    print("Testing downloads with and without range support...")
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    original_threshold = downloader.RANGED_DOWNLOAD_THRESHOLD
+    original_connections = downloader._connections
+    downloader.RANGED_DOWNLOAD_THRESHOLD = 1000
+    downloader._connections = threading.BoundedSemaphore(3)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {Path(tmp) / name: f"{base_url}/{name}" for name in ("ranges", "probe-only", "plain")}
+            download_files(files)
+            for file_path in files:
+                assert file_path.read_bytes() == PAYLOAD, f"{file_path.name} differs"
+                assert not file_path.with_name(file_path.name + '.part').exists()
+        assert _peak <= 3, f"{_peak} connections open at once"
+    finally:
+        downloader.RANGED_DOWNLOAD_THRESHOLD = original_threshold
+        downloader._connections = original_connections
+        server.shutdown()
+        server.server_close()
+
+    print("✓ Ranged, refused and unsupported range downloads all complete")
+    print(f"✓ At most {_peak} connections open at once")
+
+
+def main():
+    """Run all tests."""
+    print("=== Testing Downloader ===\n")
+
+    try:
+        test_download_fallbacks()
+
+        print("\n🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Test the I/O helpers.
+
+This script verifies the file helpers in text_kgc_data.io against their
+simplest in-memory equivalents.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import text_kgc_data.io as kg_io
+from text_kgc_data.io import (
+    ensure_directory_exists,
+    link_or_copy,
+    load_json,
+    load_json_stream,
+    load_mapping,
+    load_ndjson_stream,
+    load_standardized_kg,
+    save_json,
+    save_json_stream,
+    save_mapping,
+    save_ndjson,
+)
+
+# Keys and values that need escaping or are not ASCII
+SAMPLE = {
+    "Q1": "Barack Obama",
+    "Q2": 'quote " and backslash \\',
+    "Q3": "line\nbreak\ttab",
+    "Q4": "München 東京",
+    "Q5": "",
+    "Q 6": "emoji 😀",
+}
+
+
+def run_with_and_without_fast_deps(check) -> None:
+    """Run check with the optional orjson/ijson installs, then with neither."""
+    check()
+    saved = kg_io.orjson, kg_io.ijson
+    kg_io.orjson = kg_io.ijson = None
+    try:
+        check()
+    finally:
+        kg_io.orjson, kg_io.ijson = saved
+
+
+def test_ensure_directory_exists():
+    """Test that a directory deleted after being ensured is created again."""
+    print("Testing ensure_directory_exists...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "a" / "b"
+        ensure_directory_exists(directory)
+        assert directory.is_dir(), "Directory not created"
+
+        shutil.rmtree(Path(tmp) / "a")
+        ensure_directory_exists(directory)
+        assert directory.is_dir(), "Deleted directory not recreated"
+
+    print("✓ Directories are recreated after deletion")
+
+
+def test_link_or_copy_links():
+    """Test that link_or_copy hard-links and re-runs on the same file cleanly."""
+    print("Testing link_or_copy hard links...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "train.txt"
+        dst = Path(tmp) / "out" / "train.tsv"
+        src.write_text("a\tb\tc\n", encoding='utf-8')
+
+        link_or_copy(src, dst)
+        assert os.path.samefile(src, dst), "dst is not a hard link to src"
+        assert src.stat().st_nlink == 2
+
+        # Already linked: nothing is replaced and no temporary file is left
+        inode = dst.stat().st_ino
+        link_or_copy(src, dst)
+        assert dst.stat().st_ino == inode
+        assert sorted(p.name for p in dst.parent.iterdir()) == ["train.tsv"]
+
+        # A stale dst from an older source is replaced
+        src.unlink()
+        src.write_text("new\n", encoding='utf-8')
+        link_or_copy(src, dst)
+        assert os.path.samefile(src, dst) and dst.read_text(encoding='utf-8') == "new\n"
+
+    print("✓ Hard links created and re-runs are no-ops")
+
+
+def test_link_or_copy_fallback():
+    """Test that link_or_copy copies when hard links are not possible."""
+    print("Testing link_or_copy copy fallback...")
+
+    def failing_link(src, dst):
+        raise OSError(18, "Invalid cross-device link")
+
+    original_link = os.link
+    os.link = failing_link
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "train.txt"
+            dst = Path(tmp) / "out" / "train.tsv"
+            src.write_text("a\tb\tc\n", encoding='utf-8')
+            dst.parent.mkdir()
+            dst.write_text("stale\n", encoding='utf-8')
+
+            link_or_copy(src, dst)
+            assert not os.path.samefile(src, dst), "dst should be a separate copy"
+            assert dst.read_text(encoding='utf-8') == "a\tb\tc\n"
+            assert sorted(p.name for p in dst.parent.iterdir()) == ["train.tsv"]
+    finally:
+        os.link = original_link
+
+    print("✓ Falls back to a copy when linking fails")
+
+
+def test_json_stream_round_trip():
+    """Test that the streaming JSON helpers match load_json/save_json."""
+    print("Testing JSON stream round trip...")
+
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            streamed = Path(tmp) / "streamed.json"
+            in_memory = Path(tmp) / "in_memory.json"
+            assert save_json_stream(iter(SAMPLE.items()), streamed) == len(SAMPLE)
+            save_json(SAMPLE, in_memory)
+
+            assert streamed.read_bytes() == in_memory.read_bytes(), "Output differs from save_json"
+            assert list(load_json_stream(streamed)) == list(load_json(in_memory).items())
+
+            save_json_stream(iter([]), streamed)
+            save_json({}, in_memory)
+            assert streamed.read_bytes() == in_memory.read_bytes()
+            assert list(load_json_stream(streamed)) == []
+
+    run_with_and_without_fast_deps(check)
+
+    print("✓ Streamed JSON matches the in-memory path")
+
+
+def test_ndjson_round_trip():
+    """Test that NDJSON files read back to the mapping that was written."""
+    print("Testing NDJSON round trip...")
+
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            ndjson_file = Path(tmp) / "entity_id2description.ndjson"
+            assert save_ndjson(iter(SAMPLE.items()), ndjson_file, value_field="description") == len(SAMPLE)
+            assert list(load_ndjson_stream(ndjson_file)) == list(SAMPLE.items())
+            assert dict(load_ndjson_stream(ndjson_file, value_field="description")) == SAMPLE
+            assert len(ndjson_file.read_bytes().splitlines()) == len(SAMPLE)
+
+    run_with_and_without_fast_deps(check)
+
+    print("✓ NDJSON round trip matches the mapping")
+
+
+def test_ndjson_atomic():
+    """Test that an interrupted save_ndjson leaves the previous file in place."""
+    print("Testing interrupted NDJSON write...")
+
+    def failing_items():
+        yield "Q1", "first"
+        raise RuntimeError("interrupted")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ndjson_file = Path(tmp) / "entity_id2description.ndjson"
+        save_ndjson(iter(SAMPLE.items()), ndjson_file)
+        try:
+            save_ndjson(failing_items(), ndjson_file)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("Error from items not raised")
+        assert dict(load_ndjson_stream(ndjson_file)) == SAMPLE, "Previous file was truncated"
+        assert sorted(p.name for p in Path(tmp).iterdir()) == [ndjson_file.name], "Temporary file left behind"
+
+    print("✓ Previous output kept and no temporary file left")
+
+
+def test_msgpack_round_trip():
+    """Test msgpack mappings, or the error raised when msgpack is missing."""
+    print("Testing msgpack round trip...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        msgpack_file = Path(tmp) / "entity_id2name.msgpack"
+        if kg_io.msgpack is not None:
+            save_mapping(SAMPLE, msgpack_file)
+            assert load_mapping(msgpack_file) == SAMPLE
+            print("✓ msgpack round trip matches the mapping")
+        else:
+            print("  msgpack not installed, skipping the round trip")
+
+        saved = kg_io.msgpack
+        kg_io.msgpack = None
+        try:
+            for call in (lambda: save_mapping(SAMPLE, msgpack_file), lambda: load_mapping(msgpack_file)):
+                try:
+                    call()
+                except ImportError:
+                    pass
+                else:
+                    raise AssertionError("Missing msgpack not reported")
+        finally:
+            kg_io.msgpack = saved
+
+    print("✓ Missing msgpack raises ImportError")
+
+
+def _write_kg(dataset_dir: Path, description: str) -> None:
+    save_json({"Q1": "a"}, dataset_dir / "entity_id2name.json")
+    save_json({"Q1": description}, dataset_dir / "entity_id2description.json")
+    save_json({"P1": "r"}, dataset_dir / "relation_id2name.json")
+
+
+def test_standardized_kg_cache():
+    """Test that repeated loads return independent copies and see rewritten files."""
+    print("Testing load_standardized_kg reloads...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset_dir = Path(tmp) / "kg"
+        _write_kg(dataset_dir, "short")
+
+        first = load_standardized_kg(str(dataset_dir))
+        first["entities"]["Q2"] = "mutated"
+        assert load_standardized_kg(str(dataset_dir))["entities"] == {"Q1": "a"}, "Cached mapping was mutated"
+
+        save_json({"Q1": "rewritten"}, dataset_dir / "entity_id2name.json")
+        assert load_standardized_kg(str(dataset_dir))["entities"] == {"Q1": "rewritten"}, "Stale mapping returned"
+
+    print("✓ Reloads return copies and pick up rewritten files")
+
+
+def test_standardized_kg_cache_bound():
+    """Test that the mapping cache stays within KG_CACHE_MAX_BYTES and skips larger files."""
+    print("Testing load_standardized_kg cache...")
+
+    original_budget = kg_io.KG_CACHE_MAX_BYTES
+    kg_io._mapping_cache.clear()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            small = Path(tmp) / "small"
+            large = Path(tmp) / "large"
+            _write_kg(small, "short")
+            _write_kg(large, "x" * 1000)
+            kg_io.KG_CACHE_MAX_BYTES = 500
+
+            first = load_standardized_kg(str(small))
+            first["entities"]["Q2"] = "mutated"
+            second = load_standardized_kg(str(small))
+            assert second["entities"] == {"Q1": "a"}, "Cached mapping was mutated"
+            assert len(kg_io._mapping_cache) == 3, "Small mappings not cached"
+
+            kg = load_standardized_kg(str(large))
+            assert kg["descriptions"] == {"Q1": "x" * 1000}
+            cached_bytes = sum(size for _, size, _ in kg_io._mapping_cache)
+            assert cached_bytes <= kg_io.KG_CACHE_MAX_BYTES, cached_bytes
+            assert not any(path.endswith("entity_id2description.json") and "large" in path
+                           for path, _, _ in kg_io._mapping_cache), "Oversized mapping cached"
+    finally:
+        kg_io.KG_CACHE_MAX_BYTES = original_budget
+        kg_io._mapping_cache.clear()
+
+    print("✓ Cache bounded by size and returns independent copies")
+
+
+def main():
+    """Run all tests."""
+    print("=== Testing I/O Helpers ===\n")
+
+    try:
+        test_ensure_directory_exists()
+        test_link_or_copy_links()
+        test_link_or_copy_fallback()
+        test_json_stream_round_trip()
+        test_ndjson_round_trip()
+        test_ndjson_atomic()
+        test_msgpack_round_trip()
+        test_standardized_kg_cache()
+        test_standardized_kg_cache_bound()
+
+        print("\n🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
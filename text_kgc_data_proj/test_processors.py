@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test the mapping processors.
+
+This script checks fill_missing_entity_entries with and without inplace,
+and with a custom placeholder.
+"""
+
+import sys
+import os
+
+# Add the project to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from text_kgc_data.processors import fill_missing_entity_entries
+
+
+def _mappings():
+    names = {"Q1": "Obama", "Q2": "Hawaii"}
+    descriptions = {"Q1": "44th president", "Q3": "A city in Germany"}
+    return names, descriptions
+
+
+def test_fill_missing_copies():
+    """Test that the default call fills copies and leaves the inputs untouched."""
+    print("Testing fill_missing_entity_entries on copies...")
+
+    names, descriptions = _mappings()
+    filled_names, filled_descriptions = fill_missing_entity_entries(names, descriptions)
+
+    assert filled_names == {"Q1": "Obama", "Q2": "Hawaii", "Q3": ""}, filled_names
+    assert filled_descriptions == {"Q1": "44th president", "Q3": "A city in Germany", "Q2": ""}, filled_descriptions
+    assert (names, descriptions) == _mappings(), "Inputs were mutated"
+    assert filled_names is not names and filled_descriptions is not descriptions
+
+    print("✓ Inputs left unchanged")
+
+
+def test_fill_missing_inplace():
+    """Test that inplace=True fills and returns the given mappings."""
+    print("Testing fill_missing_entity_entries in place...")
+
+    names, descriptions = _mappings()
+    filled_names, filled_descriptions = fill_missing_entity_entries(names, descriptions, inplace=True)
+
+    assert filled_names is names and filled_descriptions is descriptions
+    assert names == {"Q1": "Obama", "Q2": "Hawaii", "Q3": ""}, names
+    assert descriptions == {"Q1": "44th president", "Q3": "A city in Germany", "Q2": ""}, descriptions
+
+    print("✓ Mappings filled in place")
+
+
+def test_fill_missing_placeholder():
+    """Test that a custom placeholder is used in both directions."""
+    print("Testing fill_missing_entity_entries placeholder...")
+
+    names, descriptions = _mappings()
+    filled_names, filled_descriptions = fill_missing_entity_entries(names, descriptions, placeholder="N/A")
+
+    assert filled_names["Q3"] == "N/A", filled_names
+    assert filled_descriptions["Q2"] == "N/A", filled_descriptions
+    assert filled_names["Q1"] == "Obama" and filled_descriptions["Q1"] == "44th president"
+
+    print("✓ Placeholder used for missing names and descriptions")
+
+
+def main():
+    """Run all tests."""
+    print("=== Testing Processors ===\n")
+
+    try:
+        test_fill_missing_copies()
+        test_fill_missing_inplace()
+        test_fill_missing_placeholder()
+
+        print("\n🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -79,6 +79,11 @@ def test_new_functions():
     fb237_relation_limit = get_truncation_limit('fb15k237', 'relation')
     assert fb237_relation_limit == 10, f"Expected 10, got {fb237_relation_limit}"
     
+    # Long text with irregular whitespace: only the kept words are normalised
+    text = "one  two\tthree\nfour " + " ".join(["filler"] * 100)
+    assert truncate_text_by_words(text, 3) == "one two three"
+    assert truncate_text_by_words("  a  b  ", 5) == "a b"
+    
     print("✓ New functions working correctly")
 
 
@@ -104,6 +109,30 @@ def test_custom_dataset():
     print("✓ Custom dataset configuration working correctly")
 
 
+def test_parallel_truncation():
+    """Test that the process-pool path matches the per-item path."""
+    print("Testing parallel truncation...")
+    
+    import text_kgc_data.processors as processors
+    
+    sample_data = {f"entity_{i}": " ".join(["word"] * (i % 20)) for i in range(100)}
+    
+    original_threshold = processors.PARALLEL_TRUNCATION_THRESHOLD
+    processors.PARALLEL_TRUNCATION_THRESHOLD = 0
+    try:
+        parallel = truncate_entity_descriptions(sample_data, max_words=5, workers=2)
+        # Serial unless workers are requested, whatever the input size
+        serial = truncate_entity_descriptions(sample_data, max_words=5)
+    finally:
+        processors.PARALLEL_TRUNCATION_THRESHOLD = original_threshold
+    
+    assert parallel == truncate_descriptions(sample_data, max_words=5), "Parallel truncation mismatch"
+    assert list(parallel) == list(sample_data), "Parallel truncation changed key order"
+    assert serial == parallel, "Serial truncation mismatch"
+    
+    print("✓ Parallel truncation matches per-item truncation")
+
+
 def test_edge_cases():
     """Test edge cases and error handling."""
     print("Testing edge cases...")
@@ -136,6 +165,7 @@ def main():
         test_dataset_aware_truncation()
         test_new_functions()
         test_custom_dataset()
+        test_parallel_truncation()
         test_edge_cases()
         
         print("\n🎉 All tests passed! Refactoring successful.")
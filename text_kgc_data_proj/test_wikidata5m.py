@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test the Wikidata5M TSV parsers.
+
+This script checks that the memory-mapped and gzip parsers return the same
+(ID, first value) pairs as the original parser, which read the whole file as
+text and split it into lines and tab-separated fields.
+"""
+
+import sys
+import os
+import gzip
+import tempfile
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from text_kgc_data.datasets.wikidata5m import (
+    _iter_first_values,
+    _iter_first_values_gz,
+    create_entity_id2description_wikidata5m,
+    create_entity_id2name_wikidata5m,
+)
+
+# Valid lines covering multiple values, trailing whitespace, CRLF endings,
+# non-ASCII text, an empty first value and blank lines in between
+WELL_FORMED = (
+    "Q1\tBarack Obama\tObama\tPresident Obama\n"
+    "Q2\tHawaii  \n"
+    "\n"
+    "Q3\tMünchen\tMunich\r\n"
+    "Q4\t東京都\n"
+    "   \n"
+    "\r\n"
+    "Q5\t\tsecond value only\n"
+    "Q6\t  padded first value  \tmore\n"
+    "Q7\tno final newline"
+)
+
+# Lines without a tab, whitespace-only lines with tabs and an empty ID
+MALFORMED = (
+    "Q1\tfirst\n"
+    "no tab here\n"
+    " \t \n"
+    "\t\n"
+    "\tempty id\n"
+    "Q2\tsecond\r\n"
+    "Q3-only\r\n"
+    "Q4\tlast"
+)
+
+
+def _reference_first_values(text):
+    """Parse like the original implementation: strip, split lines, then tabs."""
+    pairs = []
+    for line in text.strip().split('\n'):
+        if not line.strip():
+            continue
+        parts = line.split('\t')
+        if len(parts) < 2:
+            continue
+        pairs.append((parts[0], parts[1].strip()))
+    return pairs
+
+
+def _write(path: Path, text: str) -> None:
+    # The original parser read in text mode, which turns \r\n into \n
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+
+
+def _expected(text):
+    return _reference_first_values(text.replace('\r\n', '\n'))
+
+
+def test_mmap_parser_matches_reference():
+    """Test the memory-mapped parser against the line-based reference."""
+    print("Testing memory-mapped parser...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in (("well_formed", WELL_FORMED), ("malformed", MALFORMED)):
+            tsv_file = Path(tmp) / f"{name}.txt"
+            _write(tsv_file, text)
+            pairs = list(_iter_first_values(tsv_file))
+            assert pairs == _expected(text), f"{name}: {pairs}"
+
+            # Same result with a final newline
+            _write(tsv_file, text + "\n")
+            assert list(_iter_first_values(tsv_file)) == _expected(text), f"{name} with final newline"
+
+        empty = Path(tmp) / "empty.txt"
+        _write(empty, "")
+        assert list(_iter_first_values(empty)) == []
+
+    print("✓ Memory-mapped parser matches the line-based parse")
+
+
+def test_gz_parser_matches_reference():
+    """Test the gzip parser against the line-based reference."""
+    print("Testing gzip parser...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in (("well_formed", WELL_FORMED), ("malformed", MALFORMED)):
+            gz_file = Path(tmp) / f"{name}.txt.gz"
+            with gzip.open(gz_file, 'wb') as f:
+                f.write(text.encode('utf-8'))
+            assert list(_iter_first_values_gz(gz_file)) == _expected(text), name
+            # .gz files are dispatched to the gzip parser
+            assert list(_iter_first_values(gz_file)) == _expected(text), name
+
+    print("✓ Gzip parser matches the line-based parse")
+
+
+def test_strict_mappings():
+    """Test that names reject malformed lines while descriptions skip them."""
+    print("Testing strict and lenient mappings...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv_file = Path(tmp) / "wikidata5m_entity.txt"
+        _write(tsv_file, WELL_FORMED)
+        assert create_entity_id2name_wikidata5m(tsv_file) == dict(_expected(WELL_FORMED))
+
+        _write(tsv_file, MALFORMED)
+        try:
+            create_entity_id2name_wikidata5m(tsv_file)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Malformed names file accepted")
+        assert create_entity_id2description_wikidata5m(tsv_file) == dict(_expected(MALFORMED))
+
+    print("✓ Malformed lines rejected for names and skipped for descriptions")
+
+
+def main():
+    """Run all tests."""
+    print("=== Testing Wikidata5M Parsers ===\n")
+
+    try:
+        test_mmap_parser_matches_reference()
+        test_gz_parser_matches_reference()
+        test_strict_mappings()
+
+        print("\n🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test the WN18RR download step.
+
+This script replaces the network download with a stub that writes dummy
+files, and checks that existing WN18RR directories are reused or completed
+without losing anything already in them.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import text_kgc_data.datasets.wn18rr as wn18rr
+from text_kgc_data.datasets.wn18rr import DOWNLOAD_COMPLETE_MARKER, WN18RR_FILES, download_wn18rr
+
+
+def _run_download(output_dir: Path):
+    """Run download_wn18rr with a stub download; return the files it fetched."""
+    fetched = []
+
+    def fake_download_files(files, skip_existing=True):
+        for file_path in files:
+            file_path.write_text("downloaded\n", encoding='utf-8')
+            fetched.append(file_path.name)
+
+    original = wn18rr.download_files
+    wn18rr.download_files = fake_download_files
+    try:
+        data_dir = download_wn18rr(output_dir)
+    finally:
+        wn18rr.download_files = original
+    return data_dir, fetched
+
+
+def test_fresh_download():
+    """Test that a fresh download leaves every file and the marker."""
+    print("Testing fresh download...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir, fetched = _run_download(Path(tmp))
+        assert sorted(fetched) == sorted(WN18RR_FILES), fetched
+        assert sorted(p.name for p in data_dir.iterdir()) == sorted(WN18RR_FILES + [DOWNLOAD_COMPLETE_MARKER])
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ["WN18RR"], "Staging directory left behind"
+
+        # The marker short-circuits later runs
+        _, fetched = _run_download(Path(tmp))
+        assert fetched == []
+
+    print("✓ Fresh download complete and marked")
+
+
+def test_existing_complete_directory():
+    """Test that a complete directory without a marker is kept and marked."""
+    print("Testing existing complete directory...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "WN18RR"
+        data_dir.mkdir()
+        for filename in WN18RR_FILES:
+            (data_dir / filename).write_text("user data\n", encoding='utf-8')
+        (data_dir / "notes.txt").write_text("keep me\n", encoding='utf-8')
+
+        _, fetched = _run_download(Path(tmp))
+        assert fetched == [], "Complete directory downloaded again"
+        assert (data_dir / DOWNLOAD_COMPLETE_MARKER).exists()
+        assert (data_dir / "notes.txt").read_text(encoding='utf-8') == "keep me\n"
+        for filename in WN18RR_FILES:
+            assert (data_dir / filename).read_text(encoding='utf-8') == "user data\n", filename
+
+    print("✓ Existing data reused without downloading")
+
+
+def test_existing_partial_directory():
+    """Test that a partial directory only gains the files it is missing."""
+    print("Testing existing partial directory...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "WN18RR"
+        data_dir.mkdir()
+        (data_dir / "train.txt").write_text("user train\n", encoding='utf-8')
+        (data_dir / "notes.txt").write_text("keep me\n", encoding='utf-8')
+
+        _run_download(Path(tmp))
+        assert (data_dir / "train.txt").read_text(encoding='utf-8') == "user train\n"
+        assert (data_dir / "notes.txt").read_text(encoding='utf-8') == "keep me\n"
+        for filename in WN18RR_FILES[1:]:
+            assert (data_dir / filename).read_text(encoding='utf-8') == "downloaded\n", filename
+        assert (data_dir / DOWNLOAD_COMPLETE_MARKER).exists()
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ["WN18RR"], "Staging directory left behind"
+
+    print("✓ Missing files added without touching existing ones")
+
+
+def main():
+    """Run all tests."""
+    print("=== Testing WN18RR Download ===\n")
+
+    try:
+        test_fresh_download()
+        test_existing_complete_directory()
+        test_existing_partial_directory()
+
+        print("\n🎉 All tests passed!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,42 +13,100 @@ Usage:
     entity_mapping = create_entity_id2name_wn18rr(Path("definitions.txt"))
 """
 
-# Import main functions for programmatic usage
-from text_kgc_data.datasets.wn18rr import (
-    download_wn18rr,
-    create_entity_id2name_wn18rr,
-    create_entity_id2description_wn18rr,
-    create_relation_id2name_wn18rr,
-)
-
-from text_kgc_data.datasets.wikidata5m import (
-    download_wikidata5m,
-    create_entity_id2name_wikidata5m,
-    create_entity_id2description_wikidata5m,
-    create_relation_id2name_wikidata5m,
-)
-
-from text_kgc_data.processors import (
-    fill_missing_entity_entries,
-    truncate_entity_descriptions,
-    validate_entity_mappings,
-)
-
-from text_kgc_data.truncation import (
-    truncate_descriptions,
-    truncate_text_by_words,
-    get_truncation_limit,
-    add_truncation_config,
-    get_available_datasets,
-    get_dataset_config,
-)
-
-from text_kgc_data.io import (
-    load_json,
-    save_json,
-    save_entity_ids_list,
-    load_standardized_kg,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from text_kgc_data.datasets.wn18rr import (
+        download_wn18rr,
+        create_entity_id2name_wn18rr,
+        create_entity_id2description_wn18rr,
+        create_relation_id2name_wn18rr,
+        create_entity_mappings_wn18rr,
+    )
+
+    from text_kgc_data.datasets.wikidata5m import (
+        download_wikidata5m,
+        create_entity_id2name_wikidata5m,
+        create_entity_id2description_wikidata5m,
+        create_relation_id2name_wikidata5m,
+    )
+
+    from text_kgc_data.processors import (
+        fill_missing_entity_entries,
+        create_entity_ids,
+        truncate_entity_descriptions,
+        validate_entity_mappings,
+    )
+
+    from text_kgc_data.truncation import (
+        truncate_descriptions,
+        truncate_text_by_words,
+        get_truncation_limit,
+        add_truncation_config,
+        get_available_datasets,
+        get_dataset_config,
+    )
+
+    from text_kgc_data.io import (
+        load_json,
+        save_json,
+        save_entity_ids_list,
+        load_standardized_kg,
+    )
+
+# Exported name -> module that defines it. Submodules are only imported the
+# first time one of their names is accessed (PEP 562), so `import text_kgc_data`
+# and `text-kgc --help` don't pay for every dataset module up front.
+_LAZY = {
+    # WN18RR functions
+    "download_wn18rr": "text_kgc_data.datasets.wn18rr",
+    "create_entity_id2name_wn18rr": "text_kgc_data.datasets.wn18rr",
+    "create_entity_id2description_wn18rr": "text_kgc_data.datasets.wn18rr",
+    "create_relation_id2name_wn18rr": "text_kgc_data.datasets.wn18rr",
+    "create_entity_mappings_wn18rr": "text_kgc_data.datasets.wn18rr",
+
+    # Wikidata5M functions
+    "download_wikidata5m": "text_kgc_data.datasets.wikidata5m",
+    "create_entity_id2name_wikidata5m": "text_kgc_data.datasets.wikidata5m",
+    "create_entity_id2description_wikidata5m": "text_kgc_data.datasets.wikidata5m",
+    "create_relation_id2name_wikidata5m": "text_kgc_data.datasets.wikidata5m",
+
+    # Processing functions
+    "fill_missing_entity_entries": "text_kgc_data.processors",
+    "create_entity_ids": "text_kgc_data.processors",
+    "truncate_entity_descriptions": "text_kgc_data.processors",
+    "validate_entity_mappings": "text_kgc_data.processors",
+
+    # Truncation functions
+    "truncate_descriptions": "text_kgc_data.truncation",
+    "truncate_text_by_words": "text_kgc_data.truncation",
+    "get_truncation_limit": "text_kgc_data.truncation",
+    "add_truncation_config": "text_kgc_data.truncation",
+    "get_available_datasets": "text_kgc_data.truncation",
+    "get_dataset_config": "text_kgc_data.truncation",
+
+    # I/O functions
+    "load_json": "text_kgc_data.io",
+    "save_json": "text_kgc_data.io",
+    "save_entity_ids_list": "text_kgc_data.io",
+    "load_standardized_kg": "text_kgc_data.io",
+}
+
+
+def __getattr__(name):
+    """Import the defining submodule on first access to an exported name."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __version__ = "0.2.0"
 __all__ = [
@@ -57,6 +115,7 @@ __all__ = [
     "create_entity_id2name_wn18rr", 
     "create_entity_id2description_wn18rr",
     "create_relation_id2name_wn18rr",
+    "create_entity_mappings_wn18rr",
     
     # Wikidata5M functions
     "download_wikidata5m",
@@ -66,6 +125,7 @@ __all__ = [
     
     # Processing functions
     "fill_missing_entity_entries",
+    "create_entity_ids",
     "truncate_entity_descriptions",
     "validate_entity_mappings",
     
@@ -0,0 +1,18 @@
+"""Runtime type-checking switch shared by the package modules."""
+
+import os
+
+if os.environ.get("TEXT_KGC_DATA_DEBUG"):
+    from beartype import beartype
+else:
+    def beartype(func):
+        """No-op stand-in for beartype.beartype.
+        
+        beartype only samples one item per container, so each checked
+        call costs about a microsecond whatever the mapping size. The real
+        cost is at import: loading beartype and decorating every function
+        adds about 70ms to each process, including CLI startup and every
+        process-all worker. Set TEXT_KGC_DATA_DEBUG=1 to turn the checks
+        back on.
+        """
+        return func
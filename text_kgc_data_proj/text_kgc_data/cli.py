@@ -1,50 +1,9 @@
 """Command-line interface for text-kgc-data toolkit."""
 
-import os
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Optional
-from unittest import result
 import typer
-from beartype import beartype
-
-# Import dataset-specific functions
-from text_kgc_data.datasets.wn18rr import (
-    download_wn18rr,
-    create_entity_id2name_wn18rr,
-    create_entity_id2description_wn18rr,
-    create_relation_id2name_wn18rr,
-    create_entity_ids_wn18rr,
-    process_wn18rr_dataset,
-)
-from text_kgc_data.datasets.wikidata5m import (
-    download_wikidata5m,
-    create_entity_id2name_wikidata5m,
-    create_entity_id2description_wikidata5m,
-    create_relation_id2name_wikidata5m,
-    create_entity_ids_wikidata5m,
-    download_wikidata5m_transductive,
-    download_wikidata5m_inductive,
-    process_wikidata5m_transductive,
-    process_wikidata5m_inductive,
-)
-from text_kgc_data.datasets.fb15k237 import (
-    download_fb15k237,
-    process_fb15k237_dataset,
-)
-from text_kgc_data.processors import (
-    fill_missing_entity_entries,
-    truncate_entity_descriptions,
-    validate_entity_mappings,
-)
-from text_kgc_data.truncation import (
-    truncate_descriptions,
-)
-from text_kgc_data.io import (
-    load_json,
-    save_json,
-    save_entity_ids_list,
-    ensure_directory_exists,
-)
 
 app = typer.Typer(help="Text Knowledge Graph Completion Data Toolkit")
 
@@ -56,7 +15,27 @@ fb15k237_app = typer.Typer(help="FB15k-237 dataset operations")
 app.add_typer(wn18rr_app, name="wn18rr")
 app.add_typer(wikidata5m_app, name="wikidata5m")
 app.add_typer(fb15k237_app, name="fb15k237")
-app.add_typer(wikidata5m_app, name="wikidata5m")
+
+
+class EchoBatch:
+    """Collect echoed lines and write them to stdout in one call on exit.
+    
+    Used for multi-line summaries so piped or redirected output gets a single
+    write instead of one write and flush per line.
+    """
+    
+    def __init__(self):
+        self.lines = []
+    
+    def __call__(self, message: str = "") -> None:
+        self.lines.append(message)
+    
+    def __enter__(self) -> "EchoBatch":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.lines:
+            typer.echo("\n".join(self.lines))
 
 
 # ===== WN18RR Commands =====
@@ -66,6 +45,7 @@ def wn18rr_download_cmd(
     output_dir: str = typer.Argument(..., help="Directory to save downloaded data"),
 ):
     """Download WN18RR dataset from SimKGC repository."""
+    from text_kgc_data.datasets.wn18rr import download_wn18rr
     output_path = Path(output_dir)
     data_path = download_wn18rr(output_path)
     typer.echo(f"✅ WN18RR data downloaded to: {data_path}")
@@ -77,25 +57,29 @@ def wn18rr_create_entity_text_cmd(
     output_dir: str = typer.Argument(..., help="Directory to save output files"),
 ):
     """Create entity ID to name and description mappings from WN18RR definitions file."""
+    from text_kgc_data.datasets.wn18rr import (
+        create_entity_mappings_wn18rr,
+    )
+    from text_kgc_data.processors import create_entity_ids
+    from text_kgc_data.io import ensure_directory_exists, save_json, save_entity_ids_list
     definitions_path = Path(definitions_file)
     output_path = Path(output_dir)
     ensure_directory_exists(output_path)
     # Create mappings
-    typer.echo("Creating entity_id2name mapping...")
-    entity_id2name = create_entity_id2name_wn18rr(definitions_path)
-    typer.echo("Creating entity_id2description mapping...")
-    entity_id2description = create_entity_id2description_wn18rr(definitions_path)
+    typer.echo("Creating entity_id2name and entity_id2description mappings...")
+    entity_id2name, entity_id2description = create_entity_mappings_wn18rr(definitions_path)
     # Create entity IDs list
     typer.echo("Creating entity IDs list...")
-    entity_ids = create_entity_ids_wn18rr(entity_id2name, entity_id2description)
+    entity_ids = create_entity_ids(entity_id2name, entity_id2description)
     # Save files
     save_json(entity_id2name, output_path / "entity_id2name.json")
     save_json(entity_id2description, output_path / "entity_id2description.json")
     save_entity_ids_list(entity_ids, output_path / "entity_ids.txt")
-    typer.echo(f"✅ Entity mappings saved to: {output_path}")
-    typer.echo(f"   - entity_id2name.json ({len(entity_id2name)} entities)")
-    typer.echo(f"   - entity_id2description.json ({len(entity_id2description)} entities)")
-    typer.echo(f"   - entity_ids.txt ({len(entity_ids)} entities)")
+    with EchoBatch() as echo:
+        echo(f"✅ Entity mappings saved to: {output_path}")
+        echo(f"   - entity_id2name.json ({len(entity_id2name)} entities)")
+        echo(f"   - entity_id2description.json ({len(entity_id2description)} entities)")
+        echo(f"   - entity_ids.txt ({len(entity_ids)} entities)")
 
 
 @wn18rr_app.command("create-relation-text")
@@ -104,6 +88,8 @@ def wn18rr_create_relation_text_cmd(
     output_dir: str = typer.Argument(..., help="Directory to save output files"),
 ):
     """Create relation ID to name mappings from WN18RR relations file."""
+    from text_kgc_data.datasets.wn18rr import create_relation_id2name_wn18rr
+    from text_kgc_data.io import ensure_directory_exists, save_json
     relations_path = Path(relations_file)
     output_path = Path(output_dir)
     ensure_directory_exists(output_path)
@@ -112,8 +98,9 @@ def wn18rr_create_relation_text_cmd(
     relation_id2name = create_relation_id2name_wn18rr(relations_path)
     # Save file
     save_json(relation_id2name, output_path / "relation_id2name.json")
-    typer.echo(f"✅ Relation mappings saved to: {output_path}")
-    typer.echo(f"   - relation_id2name.json ({len(relation_id2name)} relations)")
+    with EchoBatch() as echo:
+        echo(f"✅ Relation mappings saved to: {output_path}")
+        echo(f"   - relation_id2name.json ({len(relation_id2name)} relations)")
 
 
 @wn18rr_app.command("process-pipeline")
@@ -123,44 +110,62 @@ def wn18rr_process_pipeline_cmd(
     fill_missing: bool = typer.Option(True, help="Fill missing entity entries"),
     truncate_descriptions: bool = typer.Option(False, help="Truncate descriptions"),
     max_words: int = typer.Option(50, help="Maximum words for truncation (SimKGC-style)"),
+    verbose: bool = typer.Option(False, help="Print each pipeline step as it starts"),
 ):
     """Run complete WN18RR processing pipeline."""
+    from text_kgc_data.datasets.wn18rr import (
+        create_entity_mappings_wn18rr,
+        create_relation_id2name_wn18rr,
+    )
+    from text_kgc_data.processors import create_entity_ids
+    from text_kgc_data.io import ensure_directory_exists, save_json, save_entity_ids_list
     raw_path = Path(raw_data_dir)
     output_path = Path(output_dir)
     ensure_directory_exists(output_path)
+    name_out = output_path / "entity_id2name.json"
+    desc_out = output_path / "entity_id2description.json"
+    rel_out = output_path / "relation_id2name.json"
+    ids_out = output_path / "entity_ids.txt"
     # Step 1: Create entity mappings
-    typer.echo("Step 1: Creating entity mappings...")
+    if verbose:
+        typer.echo("Step 1: Creating entity mappings...")
     definitions_file = raw_path / "wordnet-mlj12-definitions.txt"
-    entity_id2name = create_entity_id2name_wn18rr(definitions_file)
-    entity_id2description = create_entity_id2description_wn18rr(definitions_file)
+    entity_id2name, entity_id2description = create_entity_mappings_wn18rr(definitions_file)
     # Step 2: Create relation mappings
-    typer.echo("Step 2: Creating relation mappings...")
+    if verbose:
+        typer.echo("Step 2: Creating relation mappings...")
     relations_file = raw_path / "relations.dict"
     relation_id2name = create_relation_id2name_wn18rr(relations_file)
     # Step 3: Fill missing entries if requested
     if fill_missing:
-        typer.echo("Step 3: Filling missing entity entries...")
+        from text_kgc_data.processors import fill_missing_entity_entries
+        if verbose:
+            typer.echo("Step 3: Filling missing entity entries...")
         entity_id2name, entity_id2description = fill_missing_entity_entries(
-            entity_id2name, entity_id2description
+            entity_id2name, entity_id2description, inplace=True
         )
     # Step 4: Truncate descriptions if requested
     if truncate_descriptions:
-        typer.echo("Step 4: Truncating descriptions...")
-        entity_id2description = truncate_descriptions(
+        from text_kgc_data.processors import truncate_entity_descriptions
+        if verbose:
+            typer.echo("Step 4: Truncating descriptions...")
+        entity_id2description = truncate_entity_descriptions(
             entity_id2description, max_words=max_words, 
             dataset='wn18rr', content_type='entity'
         )
     # Step 5: Save all outputs
-    typer.echo("Step 5: Saving outputs...")
-    entity_ids = create_entity_ids_wn18rr(entity_id2name, entity_id2description)
-    save_json(entity_id2name, output_path / "entity_id2name.json")
-    save_json(entity_id2description, output_path / "entity_id2description.json")
-    save_json(relation_id2name, output_path / "relation_id2name.json")
-    save_entity_ids_list(entity_ids, output_path / "entity_ids.txt")
-    typer.echo(f"✅ WN18RR pipeline completed successfully!")
-    typer.echo(f"   Output saved to: {output_path}")
-    typer.echo(f"   - {len(entity_ids)} entities")
-    typer.echo(f"   - {len(relation_id2name)} relations")
+    if verbose:
+        typer.echo("Step 5: Saving outputs...")
+    entity_ids = create_entity_ids(entity_id2name, entity_id2description)
+    save_json(entity_id2name, name_out)
+    save_json(entity_id2description, desc_out)
+    save_json(relation_id2name, rel_out)
+    save_entity_ids_list(entity_ids, ids_out)
+    with EchoBatch() as echo:
+        echo("✅ WN18RR pipeline completed successfully!")
+        echo(f"   Output saved to: {output_path}")
+        echo(f"   - {len(entity_ids)} entities")
+        echo(f"   - {len(relation_id2name)} relations")
 
 
 # ===== Wikidata5M Commands =====
@@ -168,24 +173,64 @@ def wn18rr_process_pipeline_cmd(
 @wikidata5m_app.command("download")
 def wikidata5m_download_cmd(
     output_dir: str = typer.Argument('data/raw/wikidata5m', help="Directory to save downloaded data"),
+    decompress_text: bool = typer.Option(False, "--decompress-text", help="Also write the uncompressed wikidata5m_text.txt expected by older scripts"),
 ):
     """Download Wikidata5M dataset from SimKGC repository."""
+    from text_kgc_data.datasets.wikidata5m import download_wikidata5m
     output_path = Path(output_dir)
-    data_path = download_wikidata5m(output_path)
+    data_path = download_wikidata5m(output_path, decompress_text=decompress_text)
     typer.echo(f"✅ Wikidata5M data downloaded to: {data_path}")
 
 
 @wikidata5m_app.command("create-entity-text")
 def wikidata5m_create_entity_text_cmd(
     entity_names_file: str = typer.Argument(..., help="Path to wikidata5m_entity.txt"),
-    entity_descriptions_file: str = typer.Argument(..., help="Path to wikidata5m_text.txt"),
+    entity_descriptions_file: str = typer.Argument(..., help="Path to wikidata5m_text.txt (or .txt.gz)"),
     output_dir: str = typer.Argument(..., help="Directory to save output files"),
+    ndjson: bool = typer.Option(False, help="Stream mappings to .ndjson files instead of building JSON dicts in memory"),
 ):
     """Create entity ID to name and description mappings from Wikidata5M files."""
+    from text_kgc_data.datasets.wikidata5m import (
+        create_entity_id2name_wikidata5m,
+        create_entity_id2description_wikidata5m,
+        iter_entity_id2name_wikidata5m,
+        iter_entity_id2description_wikidata5m,
+    )
+    from text_kgc_data.processors import create_entity_ids
+    from text_kgc_data.io import ensure_directory_exists, save_json, save_entity_ids_list, save_ndjson
     names_path = Path(entity_names_file)
     descriptions_path = Path(entity_descriptions_file)
     output_path = Path(output_dir)
     ensure_directory_exists(output_path)
+    if ndjson:
+        # Only the set of IDs is kept in memory; names and descriptions are
+        # written out line by line as they are parsed
+        seen_ids = set()
+        def track_ids(pairs):
+            for entity_id, value in pairs:
+                seen_ids.add(entity_id)
+                yield entity_id, value
+        typer.echo("Streaming entity_id2name mapping...")
+        n_names = save_ndjson(
+            track_ids(iter_entity_id2name_wikidata5m(names_path)),
+            output_path / "entity_id2name.ndjson", value_field="name"
+        )
+        typer.echo("Streaming entity_id2description mapping...")
+        n_descriptions = save_ndjson(
+            track_ids(iter_entity_id2description_wikidata5m(descriptions_path)),
+            output_path / "entity_id2description.ndjson", value_field="description"
+        )
+        entity_ids = sorted(seen_ids)
+        save_entity_ids_list(entity_ids, output_path / "entity_ids.txt")
+        with EchoBatch() as echo:
+            echo(f"✅ Entity mappings saved to: {output_path}")
+            echo(f"   - entity_id2name.ndjson ({n_names} entities)")
+            echo(f"   - entity_id2description.ndjson ({n_descriptions} entities)")
+            echo(f"   - entity_ids.txt ({len(entity_ids)} entities)")
+        return
+    name_out = output_path / "entity_id2name.json"
+    desc_out = output_path / "entity_id2description.json"
+    ids_out = output_path / "entity_ids.txt"
     # Create mappings
     typer.echo("Creating entity_id2name mapping...")
     entity_id2name = create_entity_id2name_wikidata5m(names_path)
@@ -193,15 +238,16 @@ def wikidata5m_create_entity_text_cmd(
     entity_id2description = create_entity_id2description_wikidata5m(descriptions_path)
     # Create entity IDs list
     typer.echo("Creating entity IDs list...")
-    entity_ids = create_entity_ids_wikidata5m(entity_id2name, entity_id2description)
+    entity_ids = create_entity_ids(entity_id2name, entity_id2description)
     # Save files
-    save_json(entity_id2name, output_path / "entity_id2name.json")
-    save_json(entity_id2description, output_path / "entity_id2description.json")
-    save_entity_ids_list(entity_ids, output_path / "entity_ids.txt")
-    typer.echo(f"✅ Entity mappings saved to: {output_path}")
-    typer.echo(f"   - entity_id2name.json ({len(entity_id2name)} entities)")
-    typer.echo(f"   - entity_id2description.json ({len(entity_id2description)} entities)")
-    typer.echo(f"   - entity_ids.txt ({len(entity_ids)} entities)")
+    save_json(entity_id2name, name_out)
+    save_json(entity_id2description, desc_out)
+    save_entity_ids_list(entity_ids, ids_out)
+    with EchoBatch() as echo:
+        echo(f"✅ Entity mappings saved to: {output_path}")
+        echo(f"   - entity_id2name.json ({len(entity_id2name)} entities)")
+        echo(f"   - entity_id2description.json ({len(entity_id2description)} entities)")
+        echo(f"   - entity_ids.txt ({len(entity_ids)} entities)")
 
 
 @wikidata5m_app.command("create-relation-text")
@@ -210,6 +256,8 @@ def wikidata5m_create_relation_text_cmd(
     output_dir: str = typer.Argument(..., help="Directory to save output files"),
 ):
     """Create relation ID to name mappings from Wikidata5M relations file."""
+    from text_kgc_data.datasets.wikidata5m import create_relation_id2name_wikidata5m
+    from text_kgc_data.io import ensure_directory_exists, save_json
     relations_path = Path(relations_file)
     output_path = Path(output_dir)
     ensure_directory_exists(output_path)
@@ -218,8 +266,9 @@ def wikidata5m_create_relation_text_cmd(
     relation_id2name = create_relation_id2name_wikidata5m(relations_path)
     # Save file
     save_json(relation_id2name, output_path / "relation_id2name.json")
-    typer.echo(f"✅ Relation mappings saved to: {output_path}")
-    typer.echo(f"   - relation_id2name.json ({len(relation_id2name)} relations)")
+    with EchoBatch() as echo:
+        echo(f"✅ Relation mappings saved to: {output_path}")
+        echo(f"   - relation_id2name.json ({len(relation_id2name)} relations)")
 
 
 # ===== General Processing Commands =====
@@ -227,22 +276,62 @@ def wikidata5m_create_relation_text_cmd(
 @app.command("fill-missing-entries")
 def fill_missing_entries_cmd(
     entity_names_file: str = typer.Argument(..., help="Path to entity_id2name.json"),
-    entity_descriptions_file: str = typer.Argument(..., help="Path to entity_id2description.json"),
+    entity_descriptions_file: str = typer.Argument(..., help="Path to entity_id2description.json, .ndjson or .jsonl"),
     output_dir: str = typer.Argument(..., help="Directory to save output files"),
     placeholder: str = typer.Option("-", help="Placeholder character for missing entries"),
+    stream: bool = typer.Option(False, help="Stream descriptions instead of loading them into memory"),
 ):
-    """Fill missing entries in entity mappings."""
+    """Fill missing entries in entity mappings.
+    
+    NDJSON descriptions (.ndjson or .jsonl, as written by --ndjson) are always
+    streamed and produce filled_entity_id2description.ndjson.
+    """
+    from text_kgc_data.processors import fill_missing_entity_entries
+    from text_kgc_data.io import (
+        ensure_directory_exists, load_json, save_json, load_json_stream, save_json_stream,
+        load_ndjson_stream, save_ndjson,
+    )
     names_path = Path(entity_names_file)
     descriptions_path = Path(entity_descriptions_file)
     output_path = Path(output_dir)
     ensure_directory_exists(output_path)
+    ndjson = descriptions_path.suffix in ('.ndjson', '.jsonl')
+    if stream or ndjson:
+        import itertools
+        # Only the names and the description IDs are held in memory
+        typer.echo("Filling missing entity entries...")
+        entity_id2name = load_json(names_path)
+        description_ids = set()
+        
+        def filled_descriptions():
+            load_descriptions = load_ndjson_stream if ndjson else load_json_stream
+            for entity_id, description in load_descriptions(descriptions_path):
+                description_ids.add(entity_id)
+                yield entity_id, description
+            for entity_id in entity_id2name.keys() - description_ids:
+                yield entity_id, placeholder
+        
+        if ndjson:
+            save_ndjson(
+                filled_descriptions(), output_path / "filled_entity_id2description.ndjson",
+                value_field="description"
+            )
+        else:
+            save_json_stream(filled_descriptions(), output_path / "filled_entity_id2description.json")
+        missing_names = ((entity_id, placeholder) for entity_id in description_ids - entity_id2name.keys())
+        save_json_stream(
+            itertools.chain(entity_id2name.items(), missing_names),
+            output_path / "filled_entity_id2name.json",
+        )
+        typer.echo(f"✅ Missing entries filled and saved to: {output_path}")
+        return
     # Load data
     entity_id2name = load_json(names_path)
     entity_id2description = load_json(descriptions_path)
     # Fill missing entries
     typer.echo("Filling missing entity entries...")
     filled_names, filled_descriptions = fill_missing_entity_entries(
-        entity_id2name, entity_id2description, placeholder
+        entity_id2name, entity_id2description, placeholder, inplace=True
     )
     # Save results
     save_json(filled_names, output_path / "filled_entity_id2name.json")
@@ -252,49 +341,140 @@ def fill_missing_entries_cmd(
 
 @app.command("truncate-descriptions")
 def truncate_descriptions_cmd(
-    entity_descriptions_file: str = typer.Argument(..., help="Path to entity_id2description.json"),
+    entity_descriptions_file: str = typer.Argument(..., help="Path to entity_id2description.json, .ndjson or .jsonl"),
     tokenizer_name: str = typer.Option("bert-base-uncased", help="HuggingFace tokenizer name (not used in word-based truncation)"),
     output_dir: str = typer.Argument(..., help="Directory to save output files"),
     max_words: int = typer.Option(50, help="Maximum number of words (SimKGC-style)"),
     batch_size: int = typer.Option(50000, help="Batch size (not used in word-based truncation)"),
+    stream: bool = typer.Option(False, help="Truncate entry by entry instead of loading all descriptions into memory"),
+    workers: int = typer.Option(1, help="Worker processes for truncating large inputs (1 truncates in-process)"),
 ):
-    """Truncate entity descriptions to specified word length (SimKGC-compatible)."""
+    """Truncate entity descriptions to specified word length (SimKGC-compatible).
+    
+    NDJSON input (.ndjson or .jsonl, as written by --ndjson) is always streamed
+    and produces truncated_entity_id2description.ndjson.
+    """
+    from text_kgc_data.processors import truncate_entity_descriptions
+    from text_kgc_data.io import (
+        ensure_directory_exists, load_json, save_json, load_json_stream, save_json_stream,
+        load_ndjson_stream, save_ndjson,
+    )
     descriptions_path = Path(entity_descriptions_file)
     output_path = Path(output_dir)
     ensure_directory_exists(output_path)
+    if descriptions_path.suffix in ('.ndjson', '.jsonl'):
+        from text_kgc_data.truncation import truncate_text_by_words
+        typer.echo(f"Truncating descriptions to {max_words} words (SimKGC-compatible)...")
+        truncated = (
+            (entity_id, truncate_text_by_words(description, max_words) if description else '')
+            for entity_id, description in load_ndjson_stream(descriptions_path)
+        )
+        save_ndjson(truncated, output_path / "truncated_entity_id2description.ndjson", value_field="description")
+        typer.echo(f"✅ Descriptions truncated and saved to: {output_path}")
+        return
+    if stream:
+        from text_kgc_data.truncation import truncate_text_by_words
+        typer.echo(f"Truncating descriptions to {max_words} words (SimKGC-compatible)...")
+        truncated = (
+            (entity_id, truncate_text_by_words(description, max_words) if description else '')
+            for entity_id, description in load_json_stream(descriptions_path)
+        )
+        save_json_stream(truncated, output_path / "truncated_entity_id2description.json")
+        typer.echo(f"✅ Descriptions truncated and saved to: {output_path}")
+        return
     # Load data
     entity_id2description = load_json(descriptions_path)
     # Truncate descriptions
     typer.echo(f"Truncating descriptions to {max_words} words (SimKGC-compatible)...")
-    truncated_descriptions = truncate_descriptions(
-        entity_id2description, max_words=max_words
+    truncated_descriptions = truncate_entity_descriptions(
+        entity_id2description, max_words=max_words, workers=workers
     )
     # Save results
     save_json(truncated_descriptions, output_path / "truncated_entity_id2description.json")
     typer.echo(f"✅ Descriptions truncated and saved to: {output_path}")
 
 
+def _process_dataset(
+    label: str,
+    preprocess,
+    mapping_names: tuple,
+    split_files: dict,
+    data_path: Path,
+    output_path: Path,
+    force: bool = False,
+    output_format: str = 'json',
+    require_splits: bool = True,
+) -> None:
+    """Preprocess a raw dataset directory and save its mappings and splits.
+    
+    Shared by the per-dataset process commands and process-all. Nothing is
+    done when output_path was already built from the same raw inputs, unless
+    force is set.
+    
+    Args:
+        label: Dataset name used in messages
+        preprocess: Called with the raw data directory; returns the entity
+            name, entity description and relation name mappings
+        mapping_names: File names (without suffix) for the three mappings
+        split_files: Raw split file name for each split (train, valid, test)
+        data_path: Directory containing the raw files
+        output_path: Directory to save processed files
+        force: Reprocess even if the raw inputs are unchanged
+        output_format: Format of the mapping files, one of MAPPING_FORMATS
+        require_splits: Fail if a split file is missing instead of skipping it
+    """
+    from text_kgc_data.io import (
+        ensure_directory_exists, save_mapping, link_or_copy, MAPPING_FORMATS,
+        compute_input_fingerprint, is_output_cached, clear_input_fingerprint, save_input_fingerprint,
+    )
+    if output_format not in MAPPING_FORMATS:
+        raise typer.BadParameter(f"--output-format must be one of: {', '.join(MAPPING_FORMATS)}")
+    if not data_path.is_dir():
+        raise typer.BadParameter(f"{label} raw data directory not found: {data_path}")
+    splits = {
+        split: data_path / src_name
+        for split, src_name in split_files.items()
+        if require_splits or (data_path / src_name).exists()
+    }
+    output_files = [f"{name}.{output_format}" for name in mapping_names]
+    output_files += [f"{split}.tsv" for split in splits]
+    fingerprint = compute_input_fingerprint(data_path)
+    if not force and is_output_cached(output_path, fingerprint, output_files):
+        typer.echo(f"♻️ {label} inputs unchanged, using cached outputs in: {output_path}")
+        return
+    typer.echo(f"Processing {label} dataset with SimKGC compatibility...")
+    ensure_directory_exists(output_path)
+    clear_input_fingerprint(output_path)
+    mappings = preprocess(str(data_path))
+    for name, mapping in zip(mapping_names, mappings):
+        save_mapping(mapping, output_path / f"{name}.{output_format}")
+    for split, src_file in splits.items():
+        link_or_copy(src_file, output_path / f"{split}.tsv")
+    save_input_fingerprint(output_path, fingerprint, output_files)
+    typer.echo(f"✅ {label} processing complete! Outputs saved to: {output_path}")
+
+
+def _process_wn18rr(data_path: Path, output_path: Path, force: bool = False, output_format: str = 'json') -> Path:
+    """Process raw WN18RR files into output_path; see _process_dataset."""
+    from text_kgc_data.datasets.wn18rr import process_wn18rr_dataset
+    _process_dataset(
+        "WN18RR", process_wn18rr_dataset,
+        ("entity_id2name", "entity_description2name", "relation_id2name"),
+        {split: f"{split}.txt" for split in ("train", "valid", "test")},
+        data_path, output_path, force, output_format,
+    )
+    return output_path
+
+
 @wn18rr_app.command("process")
 def wn18rr_process_cmd(
     data_dir: str = typer.Argument('data/raw/wn18rr/WN18RR', help="Directory containing raw WN18RR files"),
     output_dir: str = typer.Argument('data/standardised/wn18rr', help="Directory to save processed files"),
+    force: bool = typer.Option(False, "--force", help="Reprocess even if the raw inputs are unchanged"),
+    output_format: str = typer.Option('json', "--output-format", help="Format of the mapping files: json or msgpack"),
 ):
     """Process WN18RR dataset with SimKGC-compatible preprocessing."""
-    import shutil
-    typer.echo("Processing WN18RR dataset with SimKGC compatibility...")
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-    entity_id2name, entity_description2name, relation_id2name = process_wn18rr_dataset(data_dir)
-
-    # Save results
-    save_json(entity_id2name, output_path / "entity_id2name.json")
-    save_json(entity_description2name, output_path / "entity_description2name.json")
-    save_json(relation_id2name, output_path / "relation_id2name.json")
-    shutil.copy(Path(data_dir) / "train.txt", output_path / "train.tsv")
-    shutil.copy(Path(data_dir) / "valid.txt", output_path / "valid.tsv")
-    shutil.copy(Path(data_dir) / "test.txt", output_path / "test.tsv")
-    typer.echo(f"✅ WN18RR processing complete!")
-    
+    _process_wn18rr(Path(data_dir), Path(output_dir), force, output_format)
 
 
 # ===== FB15k-237 Commands =====
@@ -304,34 +484,38 @@ def fb15k237_download_cmd(
     output_dir: str = typer.Argument('data/raw/fb15k237', help="Directory to save downloaded data"),
 ):
     """Download FB15k-237 dataset files."""
+    from text_kgc_data.datasets.fb15k237 import download_fb15k237
     typer.echo("Downloading FB15k-237 dataset...")
     download_fb15k237(output_dir)
     typer.echo(f"✅ FB15k-237 dataset downloaded to: {output_dir}")
 
 
+def _process_fb15k237(data_path: Path, output_path: Path, force: bool = False, output_format: str = 'json') -> Path:
+    """Process raw FB15k-237 files into output_path; see _process_dataset."""
+    from text_kgc_data.datasets.fb15k237 import preprocess_fb15k237_triplets
+    _process_dataset(
+        "FB15k-237",
+        lambda data_dir: preprocess_fb15k237_triplets(
+            data_dir=data_dir,
+            entity_desc_max_words=50,
+            relation_desc_max_words=10
+        ),
+        ("entity_id2name", "entity_id2description", "relation_id2name"),
+        {split: f"{split}.txt" for split in ("train", "valid", "test")},
+        data_path, output_path, force, output_format,
+    )
+    return output_path
+
+
 @fb15k237_app.command("process")
 def fb15k237_process_cmd(
     data_dir: str = typer.Argument('data/raw/fb15k237', help="Directory containing raw FB15k-237 files"),
     output_dir: str = typer.Argument('data/standardised/fb15k237', help="Directory to save processed files"),
+    force: bool = typer.Option(False, "--force", help="Reprocess even if the raw inputs are unchanged"),
+    output_format: str = typer.Option('json', "--output-format", help="Format of the mapping files: json or msgpack"),
 ):
     """Process FB15k-237 dataset with SimKGC-compatible preprocessing."""
-    typer.echo("Processing FB15k-237 dataset with SimKGC compatibility...")
-    from text_kgc_data.datasets.fb15k237 import preprocess_fb15k237_triplets
-    import shutil
-    output_path = Path(output_dir)
-    ensure_directory_exists(output_path)
-    entity_id2name, entity_id2description, relation_id2name = preprocess_fb15k237_triplets(
-        data_dir=data_dir,
-        entity_desc_max_words=50,
-        relation_desc_max_words=10
-    )
-    save_json(entity_id2name, output_path / "entity_id2name.json")
-    save_json(entity_id2description, output_path / "entity_id2description.json")
-    save_json(relation_id2name, output_path / "relation_id2name.json")
-    shutil.copy(Path(data_dir)/"train.txt", output_path / "train.tsv")
-    shutil.copy(Path(data_dir)/"valid.txt", output_path / "valid.tsv")
-    shutil.copy(Path(data_dir)/"test.txt", output_path / "test.tsv")
-    typer.echo(f"✅ FB15k-237 processing complete! Outputs saved to: {output_path}")
+    _process_fb15k237(Path(data_dir), Path(output_dir), force, output_format)
 
 
 # ===== Wikidata5M Transductive/Inductive Commands =====
@@ -341,6 +525,7 @@ def wikidata5m_download_transductive_cmd(
     output_dir: str = typer.Argument(..., help="Directory to save downloaded data"),
 ):
     """Download Wikidata5M transductive variant."""
+    from text_kgc_data.datasets.wikidata5m import download_wikidata5m_transductive
     typer.echo("Downloading Wikidata5M transductive dataset...")
     download_wikidata5m_transductive(output_dir)
     typer.echo(f"✅ Wikidata5M transductive dataset downloaded to: {output_dir}")
@@ -351,63 +536,68 @@ def wikidata5m_download_inductive_cmd(
     output_dir: str = typer.Argument(..., help="Directory to save downloaded data"),
 ):
     """Download Wikidata5M inductive variant."""
+    from text_kgc_data.datasets.wikidata5m import download_wikidata5m_inductive
     typer.echo("Downloading Wikidata5M inductive dataset...")
     download_wikidata5m_inductive(output_dir)
     typer.echo(f"✅ Wikidata5M inductive dataset downloaded to: {output_dir}")
 
 
+def _process_wikidata5m_variant(
+    variant: str,
+    data_path: Path,
+    output_path: Path,
+    force: bool = False,
+    output_format: str = 'json',
+) -> Path:
+    """Process one raw Wikidata5M variant into output_path; see _process_dataset."""
+    from text_kgc_data.datasets.wikidata5m import preprocess_wikidata5m_variant
+    _process_dataset(
+        f"Wikidata5M {variant}",
+        lambda data_dir: preprocess_wikidata5m_variant(
+            data_dir=data_dir,
+            variant=variant,
+            entity_desc_max_words=50,
+            relation_desc_max_words=30
+        ),
+        ("entity_id2name", "entity_id2description", "relation_id2name"),
+        # The raw splits are optional and only copied for reference
+        {split: f"wikidata5m_{variant}_{split}.txt" for split in ("train", "valid", "test")},
+        data_path, output_path, force, output_format,
+        require_splits=False,
+    )
+    return output_path
+
+
+def _process_wikidata5m_transductive(data_path: Path, output_path: Path, force: bool = False, output_format: str = 'json') -> Path:
+    """Process the raw Wikidata5M transductive variant into output_path."""
+    return _process_wikidata5m_variant("transductive", data_path, output_path, force, output_format)
+
+
+def _process_wikidata5m_inductive(data_path: Path, output_path: Path, force: bool = False, output_format: str = 'json') -> Path:
+    """Process the raw Wikidata5M inductive variant into output_path."""
+    return _process_wikidata5m_variant("inductive", data_path, output_path, force, output_format)
+
+
 @wikidata5m_app.command("process-transductive")
 def wikidata5m_process_transductive_cmd(
     data_dir: str = typer.Argument('data/raw/wikidata5m', help="Directory containing raw Wikidata5M files"),
     output_dir: str = typer.Argument('data/standardised/wikidata5m-transductive', help="Directory to save processed files"),
+    force: bool = typer.Option(False, "--force", help="Reprocess even if the raw inputs are unchanged"),
+    output_format: str = typer.Option('json', "--output-format", help="Format of the mapping files: json or msgpack"),
 ):
     """Process Wikidata5M transductive dataset with SimKGC-compatible preprocessing."""
-    typer.echo("Processing Wikidata5M transductive dataset with SimKGC compatibility...")
-    from text_kgc_data.datasets.wikidata5m import preprocess_wikidata5m_transductive
-    import shutil
-    output_path = Path(output_dir)
-    ensure_directory_exists(output_path)
-    entity_id2name, entity_id2description, relation_id2name = preprocess_wikidata5m_transductive(
-        data_dir=data_dir,
-        entity_desc_max_words=50,
-        relation_desc_max_words=30
-    )
-    save_json(entity_id2name, output_path / "entity_id2name.json")
-    save_json(entity_id2description, output_path / "entity_id2description.json")
-    save_json(relation_id2name, output_path / "relation_id2name.json")
-    # Optionally copy raw splits for reference
-    for split in ['train', 'valid', 'test']:
-        src_file = Path(data_dir) / f"wikidata5m_transductive_{split}.txt"
-        if src_file.exists():
-            shutil.copy(src_file, output_path / f"{split}.tsv")
-    typer.echo(f"✅ Wikidata5M transductive processing complete! Outputs saved to: {output_path}")
+    _process_wikidata5m_transductive(Path(data_dir), Path(output_dir), force, output_format)
 
 
 @wikidata5m_app.command("process-inductive")
 def wikidata5m_process_inductive_cmd(
     data_dir: str = typer.Argument('data/raw/wikidata5m', help="Directory containing raw Wikidata5M files"),
     output_dir: str = typer.Argument('data/standardised/wikidata5m-inductive', help="Directory to save processed files"),
+    force: bool = typer.Option(False, "--force", help="Reprocess even if the raw inputs are unchanged"),
+    output_format: str = typer.Option('json', "--output-format", help="Format of the mapping files: json or msgpack"),
 ):
     """Process Wikidata5M inductive dataset with SimKGC-compatible preprocessing."""
-    typer.echo("Processing Wikidata5M inductive dataset with SimKGC compatibility...")
-    from text_kgc_data.datasets.wikidata5m import preprocess_wikidata5m_inductive
-    import shutil
-    output_path = Path(output_dir)
-    ensure_directory_exists(output_path)
-    entity_id2name, entity_id2description, relation_id2name = preprocess_wikidata5m_inductive(
-        data_dir=data_dir,
-        entity_desc_max_words=50,
-        relation_desc_max_words=30
-    )
-    save_json(entity_id2name, output_path / "entity_id2name.json")
-    save_json(entity_id2description, output_path / "entity_id2description.json")
-    save_json(relation_id2name, output_path / "relation_id2name.json")
-    # Optionally copy raw splits for reference
-    for split in ['train', 'valid', 'test']:
-        src_file = Path(data_dir) / f"wikidata5m_inductive_{split}.txt"
-        if src_file.exists():
-            shutil.copy(src_file, output_path / f"{split}.tsv")
-    typer.echo(f"✅ Wikidata5M inductive processing complete! Outputs saved to: {output_path}")
+    _process_wikidata5m_inductive(Path(data_dir), Path(output_dir), force, output_format)
 
 
 def main():
@@ -416,39 +606,122 @@ def main():
 
 
 # ===== Batch Processing Commands =====
+def _download_all(base_path: Path, parallel: bool = True) -> None:
+    """Download every dataset into its own subdirectory of base_path."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from text_kgc_data.datasets.wn18rr import download_wn18rr
+    from text_kgc_data.datasets.fb15k237 import download_fb15k237
+    from text_kgc_data.datasets.wikidata5m import (
+        download_wikidata5m_transductive,
+        download_wikidata5m_inductive,
+    )
+    wn18rr_path = base_path / "wn18rr"
+    fb15k237_path = base_path / "fb15k237"
+    wikidata5m_trans_path = base_path / "wikidata5m-transductive"
+    wikidata5m_ind_path = base_path / "wikidata5m-inductive"
+    # The downloads hit unrelated URLs and write to separate directories, so
+    # they are independent and can run concurrently
+    downloads = [
+        ("WN18RR", download_wn18rr, wn18rr_path),
+        ("FB15k-237", download_fb15k237, str(fb15k237_path)),
+        ("Wikidata5M transductive", download_wikidata5m_transductive, str(wikidata5m_trans_path)),
+        ("Wikidata5M inductive", download_wikidata5m_inductive, str(wikidata5m_ind_path)),
+    ]
+    typer.echo("🚀 Starting batch download of all datasets...")
+    if parallel:
+        echo_lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=len(downloads)) as executor:
+            futures = {}
+            for name, download, target in downloads:
+                typer.echo(f"\n📥 Downloading {name} dataset...")
+                futures[executor.submit(download, target)] = (name, target)
+            for future in as_completed(futures):
+                name, target = futures[future]
+                future.result()
+                with echo_lock:
+                    typer.echo(f"✅ {name} downloaded to: {target}")
+    else:
+        for name, download, target in downloads:
+            typer.echo(f"\n📥 Downloading {name} dataset...")
+            download(target)
+            typer.echo(f"✅ {name} downloaded to: {target}")
+    with EchoBatch() as echo:
+        echo(f"\n🎉 All datasets downloaded successfully to: {base_path}")
+        echo("📁 Directory structure:")
+        echo(f"   {base_path}/wn18rr/")
+        echo(f"   {base_path}/fb15k237/")
+        echo(f"   {base_path}/wikidata5m-transductive/")
+        echo(f"   {base_path}/wikidata5m-inductive/")
+
+
 @app.command("download-all")
 def download_all_cmd(
     output_dir: str = typer.Argument("data/raw", help="Base directory to save all downloaded datasets"),
+    parallel: bool = typer.Option(True, "--parallel/--serial", help="Download the datasets concurrently"),
 ):
     """Download all datasets (WN18RR, FB15k-237, Wikidata5M transductive & inductive)."""
-    base_path = Path(output_dir)
-    typer.echo("🚀 Starting batch download of all datasets...")
-    # Download WN18RR
-    typer.echo("\n📥 Downloading WN18RR dataset...")
-    wn18rr_path = base_path / "wn18rr"
-    download_wn18rr(wn18rr_path)
-    typer.echo(f"✅ WN18RR downloaded to: {wn18rr_path}")
-    # Download FB15k-237
-    typer.echo("\n📥 Downloading FB15k-237 dataset...")
-    fb15k237_path = base_path / "fb15k237"
-    download_fb15k237(str(fb15k237_path))
-    typer.echo(f"✅ FB15k-237 downloaded to: {fb15k237_path}")
-    # Download Wikidata5M transductive
-    typer.echo("\n📥 Downloading Wikidata5M transductive dataset...")
-    wikidata5m_trans_path = base_path / "wikidata5m-transductive"
-    download_wikidata5m_transductive(str(wikidata5m_trans_path))
-    typer.echo(f"✅ Wikidata5M transductive downloaded to: {wikidata5m_trans_path}")
-    # Download Wikidata5M inductive
-    typer.echo("\n📥 Downloading Wikidata5M inductive dataset...")
-    wikidata5m_ind_path = base_path / "wikidata5m-inductive"
-    download_wikidata5m_inductive(str(wikidata5m_ind_path))
-    typer.echo(f"✅ Wikidata5M inductive downloaded to: {wikidata5m_ind_path}")
-    typer.echo(f"\n🎉 All datasets downloaded successfully to: {base_path}")
-    typer.echo("📁 Directory structure:")
-    typer.echo(f"   {base_path}/wn18rr/")
-    typer.echo(f"   {base_path}/fb15k237/") 
-    typer.echo(f"   {base_path}/wikidata5m-transductive/")
-    typer.echo(f"   {base_path}/wikidata5m-inductive/")
+    _download_all(Path(output_dir), parallel)
+
+
+# (label, raw subdirectory, output subdirectory, runner) for each dataset
+# handled by the batch commands
+DATASETS = [
+    ("WN18RR", "wn18rr/WN18RR", "wn18rr", _process_wn18rr),
+    ("FB15k-237", "fb15k237", "fb15k237", _process_fb15k237),
+    ("Wikidata5M transductive", "wikidata5m-transductive", "wikidata5m-transductive", _process_wikidata5m_transductive),
+    ("Wikidata5M inductive", "wikidata5m-inductive", "wikidata5m-inductive", _process_wikidata5m_inductive),
+]
+
+
+def _process_all(raw_base: Path, output_base: Path, skip_missing: bool = False, parallel: bool = False) -> None:
+    """Process every dataset found under raw_base into output_base.
+    
+    Datasets are processed one after another by default. With parallel=True
+    each runs in its own worker process, which is faster but holds several
+    datasets in memory at once (both Wikidata5M variants need several GB).
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    typer.echo("🚀 Starting batch processing of all datasets...")
+    datasets_processed = 0
+    datasets_skipped = 0
+    # Check every input up front so a missing dataset fails before any work starts
+    jobs = []
+    for label, raw_subdir, output_subdir, runner in DATASETS:
+        raw_path = raw_base / raw_subdir
+        if raw_path.exists():
+            jobs.append((label, runner, raw_path, output_base / output_subdir))
+        elif skip_missing:
+            typer.echo(f"⚠️ Skipping {label} (not found at {raw_path})")
+            datasets_skipped += 1
+        else:
+            raise FileNotFoundError(f"{label} data not found at {raw_path}")
+    # Each dataset has its own inputs and outputs, so the CPU-bound processing
+    # can run in separate processes. The runners truncate in-process
+    # (workers=1), so this pool is the only one and never oversubscribes the CPUs
+    if jobs and parallel:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for label, runner, raw, out in jobs:
+                typer.echo(f"\n⚙️ Processing {label} dataset...")
+                futures[executor.submit(runner, raw, out)] = label
+            for future in as_completed(futures):
+                out = future.result()
+                typer.echo(f"✅ {futures[future]} processed to: {out}")
+                datasets_processed += 1
+    else:
+        for label, runner, raw, out in jobs:
+            typer.echo(f"\n⚙️ Processing {label} dataset...")
+            out = runner(raw, out)
+            typer.echo(f"✅ {label} processed to: {out}")
+            datasets_processed += 1
+    with EchoBatch() as echo:
+        echo(f"\n🎉 Batch processing completed!")
+        echo(f"📊 Summary: {datasets_processed} processed, {datasets_skipped} skipped")
+        if datasets_processed > 0:
+            echo(f"📁 Processed datasets saved to: {output_base}")
 
 
 @app.command("process-all")
@@ -456,69 +729,13 @@ def process_all_cmd(
     raw_data_dir: str = typer.Argument("data/raw", help="Base directory containing all raw datasets"),
     output_dir: str = typer.Argument("data/standardised", help="Base directory to save all processed datasets"),
     skip_missing: bool = typer.Option(False, help="Skip datasets that don't exist instead of failing"),
+    parallel: bool = typer.Option(
+        False, "--parallel/--serial",
+        help="Process the datasets in concurrent worker processes (needs memory for several datasets at once)"
+    ),
 ):
     """Process all datasets with SimKGC-compatible preprocessing."""
-    raw_base = Path(raw_data_dir)
-    output_base = Path(output_dir)
-    typer.echo("🚀 Starting batch processing of all datasets...")
-    datasets_processed = 0
-    datasets_skipped = 0
-    # Process WN18RR
-    wn18rr_raw = raw_base / "wn18rr/WN18RR"
-    wn18rr_output = output_base / "wn18rr"
-    if wn18rr_raw.exists():
-        typer.echo("\n⚙️ Processing WN18RR dataset...")
-        process_wn18rr_dataset(str(wn18rr_raw), str(wn18rr_output))
-        typer.echo(f"✅ WN18RR processed to: {wn18rr_output}")
-        datasets_processed += 1
-    elif skip_missing:
-        typer.echo(f"⚠️ Skipping WN18RR (not found at {wn18rr_raw})")
-        datasets_skipped += 1
-    else:
-        raise FileNotFoundError(f"WN18RR data not found at {wn18rr_raw}")
-    # Process FB15k-237
-    fb15k237_raw = raw_base / "fb15k237"
-    fb15k237_output = output_base / "fb15k237"
-    if fb15k237_raw.exists():
-        typer.echo("\n⚙️ Processing FB15k-237 dataset...")
-        process_fb15k237_dataset(str(fb15k237_raw), str(fb15k237_output))
-        typer.echo(f"✅ FB15k-237 processed to: {fb15k237_output}")
-        datasets_processed += 1
-    elif skip_missing:
-        typer.echo(f"⚠️ Skipping FB15k-237 (not found at {fb15k237_raw})")
-        datasets_skipped += 1
-    else:
-        raise FileNotFoundError(f"FB15k-237 data not found at {fb15k237_raw}")
-    # Process Wikidata5M transductive
-    wikidata5m_trans_raw = raw_base / "wikidata5m-transductive"
-    wikidata5m_trans_output = output_base / "wikidata5m-transductive"
-    if wikidata5m_trans_raw.exists():
-        typer.echo("\n⚙️ Processing Wikidata5M transductive dataset...")
-        process_wikidata5m_transductive(str(wikidata5m_trans_raw), str(wikidata5m_trans_output))
-        typer.echo(f"✅ Wikidata5M transductive processed to: {wikidata5m_trans_output}")
-        datasets_processed += 1
-    elif skip_missing:
-        typer.echo(f"⚠️ Skipping Wikidata5M transductive (not found at {wikidata5m_trans_raw})")
-        datasets_skipped += 1
-    else:
-        raise FileNotFoundError(f"Wikidata5M transductive data not found at {wikidata5m_trans_raw}")
-    # Process Wikidata5M inductive
-    wikidata5m_ind_raw = raw_base / "wikidata5m-inductive"
-    wikidata5m_ind_output = output_base / "wikidata5m-inductive"
-    if wikidata5m_ind_raw.exists():
-        typer.echo("\n⚙️ Processing Wikidata5M inductive dataset...")
-        process_wikidata5m_inductive(str(wikidata5m_ind_raw), str(wikidata5m_ind_output))
-        typer.echo(f"✅ Wikidata5M inductive processed to: {wikidata5m_ind_output}")
-        datasets_processed += 1
-    elif skip_missing:
-        typer.echo(f"⚠️ Skipping Wikidata5M inductive (not found at {wikidata5m_ind_raw})")
-        datasets_skipped += 1
-    else:
-        raise FileNotFoundError(f"Wikidata5M inductive data not found at {wikidata5m_ind_raw}")
-    typer.echo(f"\n🎉 Batch processing completed!")
-    typer.echo(f"📊 Summary: {datasets_processed} processed, {datasets_skipped} skipped")
-    if datasets_processed > 0:
-        typer.echo(f"📁 Processed datasets saved to: {output_base}")
+    _process_all(Path(raw_data_dir), Path(output_dir), skip_missing, parallel)
 
 
 @app.command("download-and-process-all")
@@ -527,23 +744,28 @@ def download_and_process_all_cmd(
     output_dir: str = typer.Argument("data/standardised", help="Directory to save processed datasets"),
 ):
     """Download and process all datasets in one command (complete pipeline)."""
+    raw_path = Path(raw_data_dir)
+    output_path = Path(output_dir)
     typer.echo("🚀 Starting complete pipeline: download + process all datasets...")
     # Step 1: Download all datasets
-    typer.echo("\n" + "="*60)
-    typer.echo("📥 PHASE 1: DOWNLOADING ALL DATASETS")
-    typer.echo("="*60)
-    download_all_cmd.callback(raw_data_dir)
+    with EchoBatch() as echo:
+        echo("\n" + "="*60)
+        echo("📥 PHASE 1: DOWNLOADING ALL DATASETS")
+        echo("="*60)
+    _download_all(raw_path)
     # Step 2: Process all datasets
-    typer.echo("\n" + "="*60)
-    typer.echo("⚙️ PHASE 2: PROCESSING ALL DATASETS")
-    typer.echo("="*60)
-    process_all_cmd.callback(raw_data_dir, output_dir, skip_missing=False)
-    typer.echo("\n" + "="*60)
-    typer.echo("🎉 COMPLETE PIPELINE FINISHED SUCCESSFULLY!")
-    typer.echo("="*60)
-    typer.echo(f"📁 Raw data: {raw_data_dir}")
-    typer.echo(f"📁 Processed data: {output_dir}")
-    typer.echo("\n💡 You can now use the processed datasets for training!")
+    with EchoBatch() as echo:
+        echo("\n" + "="*60)
+        echo("⚙️ PHASE 2: PROCESSING ALL DATASETS")
+        echo("="*60)
+    _process_all(raw_path, output_path, skip_missing=False)
+    with EchoBatch() as echo:
+        echo("\n" + "="*60)
+        echo("🎉 COMPLETE PIPELINE FINISHED SUCCESSFULLY!")
+        echo("="*60)
+        echo(f"📁 Raw data: {raw_data_dir}")
+        echo(f"📁 Processed data: {output_dir}")
+        echo("\n💡 You can now use the processed datasets for training!")
 
 
 if __name__ == "__main__":
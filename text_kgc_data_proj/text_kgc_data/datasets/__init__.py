@@ -1,5 +1,64 @@
 """Dataset-specific processing functions."""
 
-from .wn18rr import *
-from .wikidata5m import *
-from .fb15k237 import *
+import importlib
+
+# Exported name -> dataset module that defines it. Modules are only imported
+# the first time one of their names is accessed (PEP 562), so importing one
+# dataset module doesn't load the others.
+_LAZY = {
+    # WN18RR
+    "DOWNLOAD_COMPLETE_MARKER": "wn18rr",
+    "download_wn18rr": "wn18rr",
+    "create_entity_id2name_wn18rr": "wn18rr",
+    "create_entity_id2description_wn18rr": "wn18rr",
+    "create_entity_mappings_wn18rr": "wn18rr",
+    "create_relation_id2name_wn18rr": "wn18rr",
+    "create_entity_ids_wn18rr": "wn18rr",
+    "process_wn18rr_dataset": "wn18rr",
+
+    # Wikidata5M
+    "PROGRESS_MINITERS": "wikidata5m",
+    "download_wikidata5m": "wikidata5m",
+    "iter_entity_id2name_wikidata5m": "wikidata5m",
+    "iter_entity_id2description_wikidata5m": "wikidata5m",
+    "create_entity_id2name_wikidata5m": "wikidata5m",
+    "create_entity_id2description_wikidata5m": "wikidata5m",
+    "create_relation_id2name_wikidata5m": "wikidata5m",
+    "create_entity_ids_wikidata5m": "wikidata5m",
+    "download_wikidata5m_transductive": "wikidata5m",
+    "download_wikidata5m_inductive": "wikidata5m",
+    "preprocess_wikidata5m_variant": "wikidata5m",
+    "preprocess_wikidata5m_transductive": "wikidata5m",
+    "preprocess_wikidata5m_inductive": "wikidata5m",
+    "process_wikidata5m_transductive": "wikidata5m",
+    "process_wikidata5m_inductive": "wikidata5m",
+
+    # FB15k-237
+    "download_fb15k237": "fb15k237",
+    "load_fb15k_entity_descriptions": "fb15k237",
+    "load_fb15k237_relations": "fb15k237",
+    "load_fb15k_entity_names": "fb15k237",
+    "preprocess_fb15k237_triplets": "fb15k237",
+    "process_fb15k237_dataset": "fb15k237",
+}
+
+_SUBMODULES = ("wn18rr", "wikidata5m", "fb15k237")
+
+
+def __getattr__(name):
+    """Import the defining dataset module on first access to an exported name."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
+
+
+__all__ = list(_LAZY)
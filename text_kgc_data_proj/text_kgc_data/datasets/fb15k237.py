@@ -1,13 +1,15 @@
 """FB15k-237 dataset processing utilities."""
 
-import json
 import os
-import urllib.request
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from ..downloader import download_files
 from ..processors import truncate_entity_descriptions
 
+# Turns Freebase relation paths like "film/film/genre" into words
+_SLASH_TO_SPACE = str.maketrans('/', ' ')
+
 
 def download_fb15k237(output_dir: str) -> None:
     """Download FB15k-237 dataset files.
@@ -32,11 +34,10 @@ def download_fb15k237(output_dir: str) -> None:
     
     print(f"Downloading FB15k-237 dataset to {output_path}")
     
-    for filename in files_to_download:
-        url = f"{base_url}/{filename}"
-        file_path = output_path / filename
-        print(f"Downloading {url}")
-        urllib.request.urlretrieve(url, file_path)
+    download_files(
+        {output_path / filename: f"{base_url}/{filename}" for filename in files_to_download},
+        skip_existing=False,
+    )
     
     # Note: FB15k_mid2name.txt and FB15k_mid2description.txt need to be obtained separately
     # These are part of the original FB15k dataset and used by SimKGC
@@ -44,54 +45,45 @@ def download_fb15k237(output_dir: str) -> None:
     print("from the original FB15k dataset for entity descriptions.")
 
 
-def load_fb15k_entity_descriptions(data_dir: str) -> Dict[str, str]:
+def load_fb15k_entity_descriptions(
+    data_dir: str,
+    names: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
     """Load FB15k entity descriptions.
     
     Args:
         data_dir: Directory containing FB15k files
+        names: Entity names already loaded with load_fb15k_entity_names;
+            read from FB15k_mid2name.txt when not given
         
     Returns:
         Dictionary mapping entity IDs to descriptions
     """
     descriptions = {}
-    names = {}
     
     # Load entity names
-    name_file = os.path.join(data_dir, "FB15k_mid2name.txt")
-    if os.path.exists(name_file):
-        with open(name_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split('\t')
-                if len(parts) >= 2:
-                    entity_id = parts[0]
-                    name = parts[1]
-                    names[entity_id] = name
+    if names is None:
+        names = load_fb15k_entity_names(data_dir)
     
     # Load entity descriptions 
     desc_file = os.path.join(data_dir, "FB15k_mid2description.txt")
     if os.path.exists(desc_file):
-        with open(desc_file, 'r', encoding='utf-8') as f:
+        with open(desc_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
             for line in f:
-                parts = line.strip().split('\t')
+                parts = line.strip().split('\t', 2)
                 if len(parts) >= 2:
                     entity_id = parts[0]
                     description = parts[1]
                     descriptions[entity_id] = description
     
-    # Combine names and descriptions, prioritizing descriptions
-    combined = {}
-    for entity_id in set(names.keys()) | set(descriptions.keys()):
-        desc = descriptions.get(entity_id, '')
-        name = names.get(entity_id, '')
-        
-        # Use description if available, otherwise use name
-        if desc:
-            combined[entity_id] = desc
-        elif name:
-            combined[entity_id] = name
-        else:
-            combined[entity_id] = ''
-            
+    # Combine names and descriptions, prioritizing descriptions: start from the
+    # names and overwrite with every non-empty description (empty ones only
+    # fill IDs that have no name)
+    combined = dict(names)
+    combined.update({
+        entity_id: desc for entity_id, desc in descriptions.items()
+        if desc or entity_id not in combined
+    })
     return combined
 
 
@@ -108,15 +100,15 @@ def load_fb15k237_relations(data_dir: str) -> Dict[str, str]:
     relations_file = os.path.join(data_dir, "relations.dict")
     
     if os.path.exists(relations_file):
-        with open(relations_file, 'r', encoding='utf-8') as f:
+        with open(relations_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
             for line in f:
-                parts = line.strip().split('\t')
+                parts = line.strip().split('\t', 2)
                 if len(parts) >= 2:
                     rel_id = parts[0]
                     rel_name = parts[1]
                     # Clean up relation name (remove namespace prefix)
                     if rel_name.startswith('/'):
-                        rel_name = rel_name[1:].replace('/', ' ')
+                        rel_name = rel_name[1:].translate(_SLASH_TO_SPACE)
                     relations[rel_id] = rel_name
     
     return relations
@@ -135,9 +127,9 @@ def load_fb15k_entity_names(data_dir: str) -> Dict[str, str]:
     # Load entity names
     name_file = os.path.join(data_dir, "FB15k_mid2name.txt")
     if os.path.exists(name_file):
-        with open(name_file, 'r', encoding='utf-8') as f:
+        with open(name_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
             for line in f:
-                parts = line.strip().split('\t')
+                parts = line.strip().split('\t', 2)
                 if len(parts) >= 2:
                     entity_id = parts[0]
                     name = parts[1]
@@ -160,11 +152,13 @@ def preprocess_fb15k237_triplets(
     # Load entity names and descriptions
     print("Loading entity names and descriptions...")
     entity_names = load_fb15k_entity_names(data_dir)
-    entity_descriptions = load_fb15k_entity_descriptions(data_dir)
+    entity_descriptions = load_fb15k_entity_descriptions(data_dir, names=entity_names)
 
     # Fill missing entries using processors
     from ..processors import fill_missing_entity_entries, validate_entity_mappings, truncate_entity_descriptions
-    filled_names, filled_descriptions = fill_missing_entity_entries(entity_names, entity_descriptions)
+    filled_names, filled_descriptions = fill_missing_entity_entries(
+        entity_names, entity_descriptions, inplace=True
+    )
 
     # Validate mappings
     if not validate_entity_mappings(filled_names, filled_descriptions):
@@ -1,27 +1,72 @@
 """Wikidata5M dataset processing functions."""
 
-import json
+import gzip
+import mmap
 import os
-import subprocess
 import shutil
+import sys
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from beartype import beartype
+from typing import Dict, Iterator, List, Tuple
+from .._typing import beartype
+from ..downloader import download_files
 from tqdm import tqdm
 
+# Refresh the parsing progress bars only every this many lines; checking the
+# clock on each of ~5M lines adds around a second per file
+PROGRESS_MINITERS = 1 << 16
+
+
+def _extract_tar(tar_path: Path) -> None:
+    """Extract a .tar.gz archive into its own directory in a single streaming pass.
+    
+    A marker file is written once extraction finishes, and the archive is
+    skipped on later runs unless it has been downloaded again since.
+    """
+    marker = tar_path.with_name(tar_path.name + '.extracted')
+    if marker.exists() and marker.stat().st_mtime_ns >= tar_path.stat().st_mtime_ns:
+        print(f"{tar_path.name} already extracted, skipping.")
+        return
+    print(f"Extracting {tar_path.name}...")
+    with tarfile.open(tar_path, 'r|gz') as archive:
+        # Reject absolute paths and links out of the directory where supported
+        if hasattr(tarfile, 'data_filter'):
+            archive.extractall(tar_path.parent, filter='data')
+        else:
+            archive.extractall(tar_path.parent)
+    marker.touch()
+
+
+def _gunzip(gz_path: Path, output_path: Path) -> None:
+    """Decompress gz_path to output_path, skipping it if already up to date."""
+    if output_path.exists() and output_path.stat().st_mtime_ns >= gz_path.stat().st_mtime_ns:
+        print(f"{output_path.name} already exists, skipping decompression.")
+        return
+    print(f"Unzipping {gz_path.name}...")
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with gzip.open(gz_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp_path, output_path)
+
 
 @beartype
-def download_wikidata5m(output_dir: Path) -> Path:
+def download_wikidata5m(output_dir: Path, decompress_text: bool = False) -> Path:
     """Download Wikidata5M dataset files from SimKGC repository.
     
+    The entity descriptions are kept as wikidata5m_text.txt.gz, which the
+    description parser reads directly. Pass decompress_text=True for the
+    older layout with a plain wikidata5m_text.txt next to the archive.
+    
     Args:
         output_dir: Directory where the raw data will be saved
+        decompress_text: Also write wikidata5m_text.txt and link it into the
+            variant directories instead of the .gz
         
     Returns:
         Path to the downloaded data directory
     """
     """Python implementation of the provided bash script to download Wikidata5M dataset."""
-    import urllib.request
     base_dir = Path(output_dir)
     base_dir.mkdir(parents=True, exist_ok=True)
 
@@ -32,31 +77,33 @@ def download_wikidata5m(output_dir: Path) -> Path:
         "wikidata5m_inductive.tar.gz": "https://huggingface.co/datasets/intfloat/wikidata5m/resolve/main/wikidata5m_inductive.tar.gz",
         "wikidata5m_alias.tar.gz": "https://huggingface.co/datasets/intfloat/wikidata5m/resolve/main/wikidata5m_alias.tar.gz",
     }
-    for fname, url in files_to_download.items():
-        dest = base_dir / fname
-        if not dest.exists():
-            print(f"Downloading {fname}...")
-            urllib.request.urlretrieve(url, dest)
-        else:
-            print(f"{fname} already exists, skipping download.")
-
-    # Extract tar files
-    for tarfile in ["wikidata5m_transductive.tar.gz", "wikidata5m_inductive.tar.gz", "wikidata5m_alias.tar.gz"]:
-        tar_path = base_dir / tarfile
-        print(f"Extracting {tarfile}...")
-        subprocess.run(["tar", "xvfz", str(tar_path)], cwd=base_dir, check=True)
-
-    # Gunzip text file
-    gz_path = base_dir / "wikidata5m_text.txt.gz"
-    print("Unzipping wikidata5m_text.txt.gz...")
-    subprocess.run(["gunzip", "-k", str(gz_path)], cwd=base_dir, check=True)
+    # Large files such as wikidata5m_text.txt.gz are fetched in parallel byte ranges
+    download_files({base_dir / fname: url for fname, url in files_to_download.items()})
+
+    # Extract tar files; the archives are independent and zlib releases the
+    # GIL, so they are extracted concurrently
+    tar_paths = [
+        base_dir / name
+        for name in ["wikidata5m_transductive.tar.gz", "wikidata5m_inductive.tar.gz", "wikidata5m_alias.tar.gz"]
+    ]
+    with ThreadPoolExecutor(max_workers=len(tar_paths)) as executor:
+        for _ in executor.map(_extract_tar, tar_paths):
+            pass
+
+    # wikidata5m_text.txt.gz is left compressed unless asked for: the
+    # description parser reads it directly, which avoids writing and
+    # re-reading the ~5GB plain text
+    text_name = "wikidata5m_text.txt.gz"
+    if decompress_text:
+        text_name = "wikidata5m_text.txt"
+        _gunzip(base_dir / "wikidata5m_text.txt.gz", base_dir / text_name)
 
     # Create symlinks for transductive
     trans_dir = base_dir.parent / "wiki5m_trans"
     trans_dir.mkdir(parents=True, exist_ok=True)
     symlinks_trans = {
         "wikidata5m_relation.txt": trans_dir / "wikidata5m_relation.txt",
-        "wikidata5m_text.txt": trans_dir / "wikidata5m_text.txt",
+        text_name: trans_dir / text_name,
         "wikidata5m_entity.txt": trans_dir / "wikidata5m_entity.txt",
         "wikidata5m_transductive_train.txt": trans_dir / "train.txt",
         "wikidata5m_transductive_valid.txt": trans_dir / "valid.txt",
@@ -75,7 +122,7 @@ def download_wikidata5m(output_dir: Path) -> Path:
     ind_dir.mkdir(parents=True, exist_ok=True)
     symlinks_ind = {
         "wikidata5m_relation.txt": ind_dir / "wikidata5m_relation.txt",
-        "wikidata5m_text.txt": ind_dir / "wikidata5m_text.txt",
+        text_name: ind_dir / text_name,
         "wikidata5m_entity.txt": ind_dir / "wikidata5m_entity.txt",
         "wikidata5m_inductive_train.txt": ind_dir / "train.txt",
         "wikidata5m_inductive_valid.txt": ind_dir / "valid.txt",
@@ -93,12 +140,6 @@ def download_wikidata5m(output_dir: Path) -> Path:
     return base_dir
 
 
-def _parse_tsv_lines(content: str) -> List[Tuple[str, ...]]:
-    """Parse TSV content into tuples."""
-    lines = content.strip().split('\n')
-    return [tuple(line.split('\t')) for line in lines if line.strip()]
-
-
 def _extract_first_value(tsv_parts: Tuple[str, ...]) -> Tuple[str, str]:
     """Extract ID and first value from TSV parts.
     
@@ -113,6 +154,124 @@ def _extract_first_value(tsv_parts: Tuple[str, ...]) -> Tuple[str, str]:
     return entity_id, first_value
 
 
+def _iter_first_values(tsv_file: Path, strict: bool = False) -> Iterator[Tuple[str, str]]:
+    """Yield (id, first value) pairs from a Wikidata5M TSV file.
+    
+    The file is memory-mapped and scanned for tab and newline bytes directly,
+    so only the ID and the first value of each line are ever decoded.
+    
+    Gzip-compressed files (``.gz``) are decompressed on the fly instead.
+    
+    Args:
+        tsv_file: Path to the TSV file
+        strict: Raise on malformed lines (fewer than two fields) instead of
+            warning and skipping them
+    """
+    if tsv_file.suffix == '.gz':
+        yield from _iter_first_values_gz(tsv_file, strict)
+        return
+    if tsv_file.stat().st_size == 0:
+        return
+    
+    with open(tsv_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # The map is read front to back once: let the kernel read ahead
+        # aggressively and drop pages behind the scan
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        size = len(mm)
+        pos = 0
+        while pos < size:
+            nl = mm.find(b'\n', pos)
+            if nl == -1:
+                nl = size
+            tab = mm.find(b'\t', pos, nl)
+            # An ID starting with a printable ASCII byte can't be blank; any
+            # other ID is decoded and checked before taking the fast path
+            if tab > pos and (32 < mm[pos] < 128 or mm[pos:tab].decode('utf-8').strip()):
+                end = mm.find(b'\t', tab + 1, nl)
+                if end == -1:
+                    end = nl
+                yield mm[pos:tab].decode('utf-8'), mm[tab + 1:end].decode('utf-8').strip()
+                pos = nl + 1
+                continue
+            # Blank, tab-less or ID-less line: decode it and handle it the
+            # same way as the line-based parser
+            line = mm[pos:nl].decode('utf-8')
+            pos = nl + 1
+            if not line.strip():
+                continue
+            try:
+                pair = _extract_first_value(tuple(line.split('\t')))
+            except ValueError as e:
+                if strict:
+                    raise
+                print(f"Warning: Skipping malformed line: {e}")
+                continue
+            yield pair
+
+
+def _iter_first_values_gz(tsv_file: Path, strict: bool = False) -> Iterator[Tuple[str, str]]:
+    """Yield (id, first value) pairs from a gzip-compressed Wikidata5M TSV file."""
+    with gzip.open(tsv_file, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                # Only the ID and first value are needed, so stop after two tabs
+                pair = _extract_first_value(tuple(line.rstrip('\n').split('\t', 2)))
+            except ValueError as e:
+                if strict:
+                    raise
+                print(f"Warning: Skipping malformed line: {e}")
+                continue
+            yield pair
+
+
+def _entity_text_file(data_dir: Path) -> Path:
+    """Return wikidata5m_text.txt in data_dir, or its .gz if only that exists."""
+    text_file = data_dir / 'wikidata5m_text.txt'
+    gz_file = data_dir / 'wikidata5m_text.txt.gz'
+    if not text_file.exists() and gz_file.exists():
+        return gz_file
+    return text_file
+
+
+@beartype
+def iter_entity_id2name_wikidata5m(entity_names_file: Path) -> Iterator[Tuple[str, str]]:
+    """Stream (entity ID, name) pairs from the Wikidata5M entity names file.
+    
+    Streaming counterpart of create_entity_id2name_wikidata5m for writing
+    output without building the full mapping in memory.
+    
+    Args:
+        entity_names_file: Path to wikidata5m_entity.txt
+        
+    Returns:
+        Iterator of (entity ID, first name) pairs
+    """
+    if not entity_names_file.exists():
+        raise FileNotFoundError(f"Entity names file not found: {entity_names_file}")
+    return _iter_first_values(entity_names_file)
+
+
+@beartype
+def iter_entity_id2description_wikidata5m(entity_descriptions_file: Path) -> Iterator[Tuple[str, str]]:
+    """Stream (entity ID, description) pairs from the Wikidata5M descriptions file.
+    
+    Streaming counterpart of create_entity_id2description_wikidata5m for
+    writing output without building the full mapping in memory.
+    
+    Args:
+        entity_descriptions_file: Path to wikidata5m_text.txt (or wikidata5m_text.txt.gz)
+        
+    Returns:
+        Iterator of (entity ID, first description) pairs
+    """
+    if not entity_descriptions_file.exists():
+        raise FileNotFoundError(f"Entity descriptions file not found: {entity_descriptions_file}")
+    return _iter_first_values(entity_descriptions_file)
+
+
 @beartype
 def create_entity_id2name_wikidata5m(entity_names_file: Path) -> Dict[str, str]:
     """Create entity_id2name mapping from Wikidata5M entity names file.
@@ -126,16 +285,12 @@ def create_entity_id2name_wikidata5m(entity_names_file: Path) -> Dict[str, str]:
     if not entity_names_file.exists():
         raise FileNotFoundError(f"Entity names file not found: {entity_names_file}")
     
-    with open(entity_names_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    entity_name_tuples = _parse_tsv_lines(content)
     entity_id2name = {}
-    
-    for parts in tqdm(entity_name_tuples, desc="Creating entity_id2name"):
-        entity_id, entity_name = _extract_first_value(parts)
-        entity_id2name[entity_id] = entity_name
-     
+    # Interned IDs are shared with the description and triplet mappings
+    intern = sys.intern
+    for entity_id, entity_name in tqdm(_iter_first_values(entity_names_file, strict=True),
+                                       desc="Creating entity_id2name", miniters=PROGRESS_MINITERS):
+        entity_id2name[intern(entity_id)] = entity_name
     
     return entity_id2name
 
@@ -145,7 +300,7 @@ def create_entity_id2description_wikidata5m(entity_descriptions_file: Path) -> D
     """Create entity_id2description mapping from Wikidata5M descriptions file.
     
     Args:
-        entity_descriptions_file: Path to wikidata5m_text.txt
+        entity_descriptions_file: Path to wikidata5m_text.txt (or wikidata5m_text.txt.gz)
         
     Returns:
         Dictionary mapping entity IDs to descriptions (first description if multiple)
@@ -153,19 +308,12 @@ def create_entity_id2description_wikidata5m(entity_descriptions_file: Path) -> D
     if not entity_descriptions_file.exists():
         raise FileNotFoundError(f"Entity descriptions file not found: {entity_descriptions_file}")
     
-    with open(entity_descriptions_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    entity_desc_tuples = _parse_tsv_lines(content)
     entity_id2description = {}
-    
-    for parts in tqdm(entity_desc_tuples, desc="Creating entity_id2description"):
-        try:
-            entity_id, description = _extract_first_value(parts)
-            entity_id2description[entity_id] = description
-        except ValueError as e:
-            print(f"Warning: Skipping malformed line: {e}")
-            continue
+    intern = sys.intern
+    # Malformed lines are reported and skipped by the parser
+    for entity_id, description in tqdm(_iter_first_values(entity_descriptions_file),
+                                       desc="Creating entity_id2description", miniters=PROGRESS_MINITERS):
+        entity_id2description[intern(entity_id)] = description
     
     return entity_id2description
 
@@ -183,16 +331,11 @@ def create_relation_id2name_wikidata5m(relations_file: Path) -> Dict[str, str]:
     if not relations_file.exists():
         raise FileNotFoundError(f"Relations file not found: {relations_file}")
     
-    with open(relations_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    relation_tuples = _parse_tsv_lines(content)
     relation_id2name = {}
-    
-    for parts in tqdm(relation_tuples, desc="Creating relation_id2name"):
-        relation_id, relation_name = _extract_first_value(parts)
-        relation_id2name[relation_id] = relation_name
-
+    intern = sys.intern
+    for relation_id, relation_name in tqdm(_iter_first_values(relations_file, strict=True),
+                                           desc="Creating relation_id2name", miniters=PROGRESS_MINITERS):
+        relation_id2name[intern(relation_id)] = relation_name
     
     return relation_id2name
 
@@ -208,8 +351,8 @@ def create_entity_ids_wikidata5m(entity_id2name: Dict[str, str], entity_id2descr
     Returns:
         Sorted list of all unique entity IDs
     """
-    all_entity_ids = set(entity_id2name.keys()) | set(entity_id2description.keys())
-    return sorted(all_entity_ids)
+    from ..processors import create_entity_ids
+    return create_entity_ids(entity_id2name, entity_id2description)
 
 
 @beartype
@@ -243,15 +386,10 @@ def download_wikidata5m_transductive(output_dir: str) -> None:
     
     print(f"Downloading Wikidata5M transductive dataset to {output_path}")
     
-    for filename, url_path in all_files.items():
-        file_path = output_path / filename
-        if not file_path.exists():
-            url = f"{base_url}/{url_path}?dl=1"
-            print(f"Downloading {filename}...")
-            import urllib.request
-            urllib.request.urlretrieve(url, file_path)
-        else:
-            print(f"{filename} already exists, skipping")
+    download_files({
+        output_path / filename: f"{base_url}/{url_path}?dl=1"
+        for filename, url_path in all_files.items()
+    })
 
 
 @beartype 
@@ -285,15 +423,10 @@ def download_wikidata5m_inductive(output_dir: str) -> None:
     
     print(f"Downloading Wikidata5M inductive dataset to {output_path}")
     
-    for filename, url_path in all_files.items():
-        file_path = output_path / filename
-        if not file_path.exists():
-            url = f"{base_url}/{url_path}?dl=1"
-            print(f"Downloading {filename}...")
-            import urllib.request
-            urllib.request.urlretrieve(url, file_path)
-        else:
-            print(f"{filename} already exists, skipping")
+    download_files({
+        output_path / filename: f"{base_url}/{url_path}?dl=1"
+        for filename, url_path in all_files.items()
+    })
 
 
 @beartype
@@ -320,18 +453,18 @@ def preprocess_wikidata5m_variant(
     # Load entity and relation mappings
     print("Loading entity names and descriptions...")
     entity_id2name = create_entity_id2name_wikidata5m(Path(data_dir)/'wikidata5m_entity.txt')
-    entity_id2description = create_entity_id2description_wikidata5m(Path(data_dir)/'wikidata5m_text.txt')
+    entity_id2description = create_entity_id2description_wikidata5m(_entity_text_file(Path(data_dir)))
 
     print("Loading relation names...")
     relation_id2name = create_relation_id2name_wikidata5m(Path(data_dir)/'wikidata5m_relation.txt')
 
     # Fill missing entries (if needed, can add a fill_missing_entity_entries step)
     # Combine entity names and descriptions (prioritize descriptions)
-    entity_descriptions = {}
-    for entity_id in set(entity_id2name.keys()) | set(entity_id2description.keys()):
-        desc = entity_id2description.get(entity_id, '')
-        name = entity_id2name.get(entity_id, '')
-        entity_descriptions[entity_id] = desc if desc else name
+    entity_descriptions = dict(entity_id2name)
+    entity_descriptions.update({
+        entity_id: desc for entity_id, desc in entity_id2description.items()
+        if desc or entity_id not in entity_descriptions
+    })
 
     # Truncate descriptions
     print("Truncating entity descriptions...")
@@ -5,21 +5,28 @@ import os
 import subprocess
 import shutil
 from pathlib import Path
-from typing import Dict, List, Tuple
-from beartype import beartype
+from typing import Dict, Iterator, List, Tuple
+from .._typing import beartype
+from ..downloader import download_files
 from tqdm import tqdm
 
+# Written into the WN18RR directory once a download has been fully copied
+DOWNLOAD_COMPLETE_MARKER = ".download_complete"
 
-@beartype
-def download_wn18rr(output_dir: Path) -> Path:
-    """Download WN18RR dataset files from SimKGC repository.
-    
-    Args:
-        output_dir: Directory where the raw data will be saved
-        
-    Returns:
-        Path to the downloaded data directory
-    """
+# WN18RR is checked into the SimKGC repository, so its files can be fetched
+# individually instead of cloning the repository
+WN18RR_BASE_URL = "https://raw.githubusercontent.com/intfloat/SimKGC/main/data/WN18RR"
+WN18RR_FILES = [
+    "train.txt",
+    "valid.txt",
+    "test.txt",
+    "wordnet-mlj12-definitions.txt",
+    "relations.dict",
+]
+
+
+def _clone_wn18rr(staging_dir: Path) -> None:
+    """Copy the WN18RR data out of a clone of the SimKGC repository."""
     repo_url = "https://github.com/intfloat/SimKGC.git"
     temp_dir = "temp_SimKGC"
     
@@ -29,9 +36,14 @@ def download_wn18rr(output_dir: Path) -> Path:
             shutil.rmtree(temp_dir)
         
         print(f"Cloning {repo_url}...")
+        # Only the files at the tip are needed, so skip history, tags and
+        # other branches
         result = subprocess.run(
-            ["git", "clone", repo_url, temp_dir], 
-            capture_output=True, 
+            ["git", "clone", "--depth=1", "--single-branch", "--filter=blob:none",
+             "--no-tags", repo_url, temp_dir],
+            # Only stderr is needed, for the error message
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -49,29 +61,18 @@ def download_wn18rr(output_dir: Path) -> Path:
         result = subprocess.run(
             ["bash", "scripts/download_wikidata5m.sh"],
             cwd=temp_dir,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
         if result.returncode != 0:
             raise RuntimeError(f"Download script failed: {result.stderr}")
         
-        # Move WN18RR data to output directory
         source_data_dir = Path(temp_dir) / "data" / "WN18RR"
-        output_path = Path(output_dir)
-        wn18rr_output = output_path / "WN18RR"
-        
-        if source_data_dir.exists():
-            output_path.mkdir(parents=True, exist_ok=True)
-            if wn18rr_output.exists():
-                print(f"WN18RR data already exists at {wn18rr_output}")
-            else:
-                shutil.copytree(source_data_dir, wn18rr_output)
-                print(f"WN18RR data saved to {wn18rr_output}")
-        else:
+        if not source_data_dir.exists():
             raise FileNotFoundError(f"WN18RR data not found at {source_data_dir}")
-        
-        return wn18rr_output
+        shutil.copytree(source_data_dir, staging_dir)
         
     finally:
         # Clean up temp directory
@@ -79,10 +80,70 @@ def download_wn18rr(output_dir: Path) -> Path:
             shutil.rmtree(temp_dir)
 
 
-def _parse_tsv_lines(content: str) -> List[Tuple[str, ...]]:
-    """Parse TSV content into tuples."""
-    lines = content.strip().split('\n')
-    return [tuple(line.split('\t')) for line in lines if line.strip()]
+@beartype
+def download_wn18rr(output_dir: Path) -> Path:
+    """Download WN18RR dataset files from SimKGC repository.
+    
+    The files are fetched directly from the repository's raw URLs; cloning
+    the repository is only used as a fallback if that fails. An existing
+    WN18RR directory is never deleted: if it already holds every file it is
+    used as is, otherwise only the files it lacks are added.
+    
+    Args:
+        output_dir: Directory where the raw data will be saved
+        
+    Returns:
+        Path to the downloaded data directory
+    """
+    wn18rr_output = Path(output_dir) / "WN18RR"
+    marker = wn18rr_output / DOWNLOAD_COMPLETE_MARKER
+    if marker.exists():
+        print(f"WN18RR data already exists at {wn18rr_output}")
+        return wn18rr_output
+    if all((wn18rr_output / filename).exists() for filename in WN18RR_FILES):
+        # Downloaded before the marker existed, or put there by hand
+        marker.touch()
+        print(f"WN18RR data already exists at {wn18rr_output}")
+        return wn18rr_output
+    
+    # Download next to the destination and rename it into place, so an
+    # interrupted download is never mistaken for a complete one
+    staging_dir = wn18rr_output.with_name(wn18rr_output.name + ".tmp")
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir(parents=True)
+    
+    try:
+        print("Downloading WN18RR dataset...")
+        download_files(
+            {staging_dir / filename: f"{WN18RR_BASE_URL}/{filename}" for filename in WN18RR_FILES},
+            skip_existing=False,
+        )
+    except OSError as e:
+        print(f"Direct download failed ({e}), falling back to cloning SimKGC")
+        shutil.rmtree(staging_dir)
+        _clone_wn18rr(staging_dir)
+    
+    (staging_dir / DOWNLOAD_COMPLETE_MARKER).touch()
+    if wn18rr_output.exists():
+        # Keep whatever is already there and only add the missing files,
+        # moving the marker last so an interrupted move isn't marked complete
+        for staged in sorted(staging_dir.iterdir(), key=lambda path: path.name == DOWNLOAD_COMPLETE_MARKER):
+            if not (wn18rr_output / staged.name).exists():
+                os.replace(staged, wn18rr_output / staged.name)
+        shutil.rmtree(staging_dir)
+    else:
+        os.replace(staging_dir, wn18rr_output)
+    print(f"WN18RR data saved to {wn18rr_output}")
+    return wn18rr_output
+
+
+def _iter_tsv_lines(tsv_file: Path) -> Iterator[Tuple[str, ...]]:
+    """Stream the non-blank lines of a TSV file as tuples of fields."""
+    with open(tsv_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        for line in f:
+            if line.strip():
+                yield tuple(line.rstrip('\r\n').split('\t'))
 
 
 def _clean_wn18rr_entity_name(raw_name: str) -> str:
@@ -109,10 +170,7 @@ def create_entity_id2name_wn18rr(definitions_file: Path) -> Dict[str, str]:
     if not definitions_file.exists():
         raise FileNotFoundError(f"Definitions file not found: {definitions_file}")
     
-    with open(definitions_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    definition_tuples = _parse_tsv_lines(content)
+    definition_tuples = _iter_tsv_lines(definitions_file)
     entity_id2name = {}
     
     for entity_id, raw_name, _ in tqdm(definition_tuples, desc="Creating entity_id2name"):
@@ -134,10 +192,7 @@ def create_entity_id2description_wn18rr(definitions_file: Path) -> Dict[str, str
     if not definitions_file.exists():
         raise FileNotFoundError(f"Definitions file not found: {definitions_file}")
     
-    with open(definitions_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    definition_tuples = _parse_tsv_lines(content)
+    definition_tuples = _iter_tsv_lines(definitions_file)
     entity_id2description = {}
     
     for entity_id, _, description in tqdm(definition_tuples, desc="Creating entity_id2description"):
@@ -146,6 +201,34 @@ def create_entity_id2description_wn18rr(definitions_file: Path) -> Dict[str, str
     return entity_id2description
 
 
+@beartype
+def create_entity_mappings_wn18rr(definitions_file: Path) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Create entity_id2name and entity_id2description mappings in one pass.
+    
+    Equivalent to calling create_entity_id2name_wn18rr and
+    create_entity_id2description_wn18rr, but reads and parses the definitions
+    file only once.
+    
+    Args:
+        definitions_file: Path to wordnet-mlj12-definitions.txt
+        
+    Returns:
+        Tuple of (entity_id2name, entity_id2description)
+    """
+    if not definitions_file.exists():
+        raise FileNotFoundError(f"Definitions file not found: {definitions_file}")
+    
+    definition_tuples = _iter_tsv_lines(definitions_file)
+    entity_id2name = {}
+    entity_id2description = {}
+    
+    for entity_id, raw_name, description in tqdm(definition_tuples, desc="Creating entity mappings"):
+        entity_id2name[entity_id] = _clean_wn18rr_entity_name(raw_name)
+        entity_id2description[entity_id] = description.strip()
+    
+    return entity_id2name, entity_id2description
+
+
 @beartype
 def create_relation_id2name_wn18rr(relations_file: Path) -> Dict[str, str]:
     """Create relation_id2name mapping from WN18RR relations file.
@@ -159,10 +242,7 @@ def create_relation_id2name_wn18rr(relations_file: Path) -> Dict[str, str]:
     if not relations_file.exists():
         raise FileNotFoundError(f"Relations file not found: {relations_file}")
     
-    with open(relations_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    relation_tuples = _parse_tsv_lines(content)
+    relation_tuples = _iter_tsv_lines(relations_file)
     relation_id2name = {}
     
     for index, relation_id in relation_tuples:
@@ -184,8 +264,8 @@ def create_entity_ids_wn18rr(entity_id2name: Dict[str, str], entity_id2descripti
     Returns:
         Sorted list of all unique entity IDs
     """
-    all_entity_ids = set(entity_id2name.keys()) | set(entity_id2description.keys())
-    return sorted(all_entity_ids)
+    from ..processors import create_entity_ids
+    return create_entity_ids(entity_id2name, entity_id2description)
 
 
 @beartype
@@ -200,22 +280,21 @@ def process_wn18rr_dataset(data_dir: str) -> Tuple[Dict[str, str], Dict[str, str
     
 
     
-    print("Loading WN18RR entity names...")
-    entity_id2name = create_entity_id2name_wn18rr(Path(data_dir)/'wordnet-mlj12-definitions.txt')
-    
-    print("Loading WN18RR entity descriptions...")
-    entity_id2description = create_entity_id2description_wn18rr(Path(data_dir)/'wordnet-mlj12-definitions.txt')
+    print("Loading WN18RR entity names and descriptions...")
+    # Names and descriptions come from the same file, so parse it once
+    entity_id2name, entity_id2description = create_entity_mappings_wn18rr(
+        Path(data_dir)/'wordnet-mlj12-definitions.txt'
+    )
 
     print("Loading WN18RR relation names...")
     relation_id2name = create_relation_id2name_wn18rr(Path(data_dir)/'relations.dict')
 
-    # Combine entity names and descriptions (prioritize descriptions)
-    entity_descriptions = {}
-    for entity_id in set(entity_id2name.keys()) | set(entity_id2description.keys()):
-        desc = entity_id2description.get(entity_id, '')
-        name = entity_id2name.get(entity_id, '')
-        # Use description if available, otherwise use name
-        entity_descriptions[entity_id] = desc if desc else name
+    # Combine entity names and descriptions (prioritize descriptions). Both
+    # mappings come from the same lines, so they have exactly the same IDs
+    entity_descriptions = {
+        entity_id: description or entity_id2name[entity_id]
+        for entity_id, description in entity_id2description.items()
+    }
     
     # Apply SimKGC-compatible truncation for WN18RR
     print("Truncating entity descriptions...")
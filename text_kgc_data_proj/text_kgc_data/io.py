@@ -2,9 +2,34 @@
 
 import json
 import os
+import shutil
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Any
-from beartype import beartype
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from ._typing import beartype
+
+try:
+    import orjson
+except ImportError:  # optional dependency, see the "fast" extra
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional dependency, see the "fast" extra
+    ijson = None
+
+try:
+    import msgpack
+except ImportError:  # optional dependency, see the "fast" extra
+    msgpack = None
+
+# File formats supported for the id-to-text mapping files
+MAPPING_FORMATS = ('json', 'msgpack')
+
+# Mappings with more entries than this are saved as compact JSON; at
+# Wikidata5M scale indentation adds hundreds of MB of whitespace
+COMPACT_JSON_THRESHOLD = 1_000_000
 
 
 @beartype
@@ -20,23 +45,251 @@ def load_json(file_path: Path) -> Dict[str, str]:
     if not file_path.exists():
         raise FileNotFoundError(f"JSON file not found: {file_path}")
     
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
+    
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 @beartype
-def save_json(data: Dict[str, str], file_path: Path) -> None:
+def save_json(data: Dict[str, str], file_path: Path, compact: Optional[bool] = None) -> None:
     """Save data to a JSON file.
     
+    Uses orjson when it is installed, falling back to the standard library.
+    The data is written to a temporary file next to file_path and moved into
+    place once complete, so an interrupted write never leaves a truncated file.
+    
     Args:
         data: Dictionary to save
         file_path: Path where to save the JSON file
+        compact: Write without indentation; by default only mappings larger
+            than COMPACT_JSON_THRESHOLD are written compactly
     """
+    if compact is None:
+        compact = len(data) > COMPACT_JSON_THRESHOLD
     # Create parent directories if they don't exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = file_path.with_name(file_path.name + '.tmp')
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    try:
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            payload = memoryview(orjson.dumps(data, option=option))
+            with open(tmp, 'wb', buffering=0) as f:
+                # Write in 1 MiB slices so multi-GB payloads go out in large chunks
+                for start in range(0, len(payload), 1 << 20):
+                    f.write(payload[start:start + (1 << 20)])
+        else:
+            with open(tmp, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                if compact:
+                    json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+                else:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, file_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@beartype
+def load_msgpack(file_path: Path) -> Dict[str, str]:
+    """Load a msgpack file written by save_msgpack.
+    
+    Args:
+        file_path: Path to the msgpack file
+        
+    Returns:
+        Dictionary loaded from the msgpack file
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required to read .msgpack files: pip install msgpack")
+    if not file_path.exists():
+        raise FileNotFoundError(f"msgpack file not found: {file_path}")
+    return msgpack.unpackb(file_path.read_bytes(), raw=False)
+
+
+@beartype
+def save_msgpack(data: Dict[str, str], file_path: Path) -> None:
+    """Save data to a msgpack file, atomically like save_json.
+    
+    msgpack is much smaller and faster to parse than indented JSON, which
+    suits mappings that are only read back by code.
+    
+    Args:
+        data: Dictionary to save
+        file_path: Path where to save the msgpack file
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required to write .msgpack files: pip install msgpack")
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = file_path.with_name(file_path.name + '.tmp')
+    
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(msgpack.packb(data, use_bin_type=True))
+        os.replace(tmp, file_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@beartype
+def load_mapping(file_path: Path) -> Dict[str, str]:
+    """Load a mapping file, choosing the format from its suffix.
+    
+    Args:
+        file_path: Path to a .json or .msgpack file
+        
+    Returns:
+        Dictionary loaded from the file
+    """
+    if file_path.suffix == '.msgpack':
+        return load_msgpack(file_path)
+    return load_json(file_path)
+
+
+@beartype
+def save_mapping(data: Dict[str, str], file_path: Path) -> None:
+    """Save a mapping file, choosing the format from its suffix.
+    
+    Args:
+        data: Dictionary to save
+        file_path: Path ending in .json or .msgpack
+    """
+    if file_path.suffix == '.msgpack':
+        save_msgpack(data, file_path)
+    else:
+        save_json(data, file_path)
+
+
+def load_json_stream(file_path: Path) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the (key, value) pairs of a JSON object file.
+    
+    With ijson installed the file is parsed incrementally, so only one entry
+    is in memory at a time. Without it the whole file is loaded first.
+    
+    Args:
+        file_path: Path to a JSON file holding a single object
+        
+    Returns:
+        Iterator of (key, value) pairs in file order
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"JSON file not found: {file_path}")
+    
+    if ijson is None:
+        yield from load_json(file_path).items()
+        return
+    
+    with open(file_path, 'rb') as f:
+        yield from ijson.kvitems(f, '')
+
+
+def save_json_stream(items: Iterable[Tuple[str, Any]], file_path: Path) -> int:
+    """Write (key, value) pairs to a JSON object file as they are produced.
+    
+    The output is formatted like save_json's indented output, and is written to a
+    temporary file that is moved into place once complete.
+    
+    Args:
+        items: Iterable of (key, value) pairs
+        file_path: Path where to save the JSON file
+        
+    Returns:
+        Number of entries written
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = file_path.with_name(file_path.name + '.tmp')
+    
+    count = 0
+    try:
+        with open(tmp, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write('{')
+            for key, value in items:
+                f.write(',\n  ' if count else '\n  ')
+                f.write(json.dumps(key, ensure_ascii=False))
+                f.write(': ')
+                f.write(json.dumps(value, ensure_ascii=False))
+                count += 1
+            f.write('\n}' if count else '}')
+        os.replace(tmp, file_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def load_ndjson_stream(
+    file_path: Path,
+    value_field: Optional[str] = None
+) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the (id, value) pairs of a newline-delimited JSON file.
+    
+    Reads files in the format written by save_ndjson one line at a time, so
+    only the current record is held in memory.
+    
+    Args:
+        file_path: Path to the NDJSON file
+        value_field: Name of the JSON field holding the value; defaults to
+            the first field other than "id"
+        
+    Returns:
+        Iterator of (id, value) pairs in file order
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"NDJSON file not found: {file_path}")
+    
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(file_path, 'rb', buffering=1 << 20) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = loads(line)
+            item_id = record.pop("id")
+            if value_field is not None:
+                yield item_id, record[value_field]
+            else:
+                yield item_id, next(iter(record.values()))
+
+
+def save_ndjson(
+    items: Iterable[Tuple[str, str]],
+    file_path: Path,
+    value_field: str = "value"
+) -> int:
+    """Stream (id, value) pairs to a newline-delimited JSON file.
+    
+    Each pair is written as one ``{"id": ..., <value_field>: ...}`` object per
+    line as it is produced, so the full mapping never has to be held in memory.
+    The records go to a temporary file that is moved into place once complete.
+    
+    Args:
+        items: Iterable of (id, value) pairs
+        file_path: Path where to save the NDJSON file
+        value_field: Name of the JSON field holding the value
+        
+    Returns:
+        Number of records written
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = file_path.with_name(file_path.name + '.tmp')
+    
+    count = 0
+    try:
+        with open(tmp, 'wb', buffering=1 << 20) as f:
+            for item_id, value in items:
+                record = {"id": item_id, value_field: value}
+                if orjson is not None:
+                    f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+                else:
+                    f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+                count += 1
+        os.replace(tmp, file_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return count
 
 
 @beartype
@@ -79,8 +332,166 @@ def save_entity_ids_list(entity_ids: List[str], file_path: Path) -> None:
         entity_ids: List of entity IDs
         file_path: Path where to save the entity IDs file
     """
-    content = '\n'.join(entity_ids)
-    save_text_file(content, file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Join and write 64K IDs at a time through a 1 MiB buffer: few write
+    # syscalls, without building one string holding millions of IDs
+    chunk_size = 1 << 16
+    with open(file_path, 'wb', buffering=1 << 20) as f:
+        for start in range(0, len(entity_ids), chunk_size):
+            if start:
+                f.write(b'\n')
+            f.write('\n'.join(entity_ids[start:start + chunk_size]).encode('utf-8'))
+
+
+# ioctl request number for FICLONE (copy-on-write clone) on Linux
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst, using a copy-on-write clone where the filesystem supports it."""
+    if sys.platform.startswith('linux'):
+        import fcntl
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    # copyfile uses os.sendfile where available and skips copy()'s
+    # permission-bit copy, which these mirrored split files don't need
+    shutil.copyfile(src, dst)
+
+
+@beartype
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Make dst a hard link to src, falling back to a clone or a plain copy.
+    
+    Used to mirror raw split files (train/valid/test) into output directories
+    without rewriting their bytes. Hard links fail across devices, in which
+    case a copy-on-write clone is tried on Linux before a regular copy. Any
+    existing dst is replaced atomically.
+    
+    Note that with a hard link, dst and src share their contents: editing one
+    in place edits the other.
+    
+    Args:
+        src: Existing file to mirror
+        dst: Path of the mirrored file
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # Renaming onto a link of the same file is a no-op that would leave tmp behind
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    tmp = dst.with_name(dst.name + '.tmp')
+    if tmp.exists():
+        tmp.unlink()
+    
+    try:
+        os.link(src, tmp)
+    except OSError:
+        _clone_or_copy(src, tmp)
+    os.replace(tmp, dst)
+
+
+# Name of the file recording which inputs an output directory was built from
+CACHE_FINGERPRINT_FILE = ".cache_fingerprint.json"
+
+
+@beartype
+def compute_input_fingerprint(data_dir: Path) -> Dict[str, List[int]]:
+    """Fingerprint the files in a raw data directory by size and mtime.
+    
+    Args:
+        data_dir: Directory containing the raw input files
+        
+    Returns:
+        Dictionary mapping each file name to ``[size, mtime_ns]``
+        
+    Raises:
+        FileNotFoundError: If data_dir is not an existing directory
+    """
+    if not data_dir.is_dir():
+        raise FileNotFoundError(f"Raw data directory not found: {data_dir}")
+    
+    fingerprint = {}
+    for entry in sorted(os.scandir(data_dir), key=lambda e: e.name):
+        if entry.is_file():
+            stat = entry.stat()
+            fingerprint[entry.name] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+@beartype
+def is_output_cached(
+    output_dir: Path,
+    fingerprint: Dict[str, List[int]],
+    output_files: List[str]
+) -> bool:
+    """Check whether an output directory was already built from the given inputs.
+    
+    Args:
+        output_dir: Directory holding the processed outputs
+        fingerprint: Current fingerprint of the inputs, see compute_input_fingerprint
+        output_files: Names of the files the outputs consist of
+        
+    Returns:
+        True if the stored fingerprint matches, and every output file was
+        recorded with it and still exists with the recorded size
+    """
+    fingerprint_file = output_dir / CACHE_FINGERPRINT_FILE
+    try:
+        with open(fingerprint_file, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+        if record["inputs"] != fingerprint or sorted(record["outputs"]) != sorted(output_files):
+            return False
+        return all(
+            (output_dir / name).stat().st_size == size
+            for name, size in record["outputs"].items()
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing, unreadable or old-style records, and deleted outputs
+        return False
+
+
+@beartype
+def save_input_fingerprint(
+    output_dir: Path,
+    fingerprint: Dict[str, List[int]],
+    output_files: List[str]
+) -> None:
+    """Record the input fingerprint an output directory was built from.
+    
+    The size of each output file is recorded too, so outputs that are later
+    deleted or rewritten are not mistaken for cached ones. Written to a
+    temporary file and moved into place so an interrupted run never leaves
+    a fingerprint that claims the outputs are complete.
+    
+    Args:
+        output_dir: Directory holding the processed outputs
+        fingerprint: Fingerprint of the inputs, see compute_input_fingerprint
+        output_files: Names of the files the outputs consist of
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    record = {
+        "inputs": fingerprint,
+        "outputs": {name: (output_dir / name).stat().st_size for name in output_files},
+    }
+    fingerprint_file = output_dir / CACHE_FINGERPRINT_FILE
+    tmp = fingerprint_file.with_name(fingerprint_file.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(record, f)
+    os.replace(tmp, fingerprint_file)
+
+
+@beartype
+def clear_input_fingerprint(output_dir: Path) -> None:
+    """Remove the recorded input fingerprint before outputs are rewritten.
+    
+    Args:
+        output_dir: Directory holding the processed outputs
+    """
+    (output_dir / CACHE_FINGERPRINT_FILE).unlink(missing_ok=True)
 
 
 @beartype
@@ -93,6 +504,33 @@ def ensure_directory_exists(directory_path: Path) -> None:
     directory_path.mkdir(parents=True, exist_ok=True)
 
 
+# Total size of the mapping files whose parsed contents load_standardized_kg
+# keeps between calls; larger files are parsed on every call instead of
+# pinning gigabytes of Wikidata5M-scale mappings for the life of the process
+KG_CACHE_MAX_BYTES = 256 << 20
+
+# (resolved path, size, mtime_ns) -> parsed mapping, least recently used first
+_mapping_cache: "OrderedDict[Tuple[str, int, int], Dict[str, str]]" = OrderedDict()
+
+
+def _load_mapping_copy(file_path: Path) -> Dict[str, str]:
+    """Load a mapping through the parse cache, returning a dict callers may modify."""
+    stat = file_path.stat()
+    if stat.st_size > KG_CACHE_MAX_BYTES:
+        # Not cached, so the freshly parsed mapping can be handed over as is
+        return load_mapping(file_path)
+
+    # Size and mtime are part of the key so rewritten files are parsed again
+    key = (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    mapping = _mapping_cache.pop(key, None)
+    if mapping is None:
+        mapping = load_mapping(file_path)
+    _mapping_cache[key] = mapping
+    while sum(cached_size for _, cached_size, _ in _mapping_cache) > KG_CACHE_MAX_BYTES:
+        _mapping_cache.popitem(last=False)
+    return dict(mapping)
+
+
 @beartype
 def load_standardized_kg(dataset_dir: str) -> Dict[str, Dict[str, str]]:
     """Load standardized knowledge graph data from a dataset directory.
@@ -102,6 +540,13 @@ def load_standardized_kg(dataset_dir: str) -> Dict[str, Dict[str, str]]:
     - entity_id2description.json: Entity ID to description mappings  
     - relation_id2name.json: Relation ID to name mappings
     
+    The .msgpack variants written with --output-format msgpack are used when
+    the JSON files are absent.
+    
+    Parsed files up to KG_CACHE_MAX_BYTES in total are cached, keyed on their
+    size and modification time, so loading the same small dataset again only
+    copies the mappings.
+    
     Args:
         dataset_dir: Path to directory containing standardized dataset files
         
@@ -120,20 +565,21 @@ def load_standardized_kg(dataset_dir: str) -> Dict[str, Dict[str, str]]:
     """
     dataset_path = Path(dataset_dir)
     
+    # Datasets processed with --output-format msgpack have no JSON files
+    suffix = "json"
+    if not (dataset_path / "entity_id2name.json").exists() and (dataset_path / "entity_id2name.msgpack").exists():
+        suffix = "msgpack"
+    
     # Define expected file paths
-    entity_names_file = dataset_path / "entity_id2name.json"
-    entity_descriptions_file = dataset_path / "entity_id2description.json"
-    relation_names_file = dataset_path / "relation_id2name.json"
+    entity_names_file = dataset_path / f"entity_id2name.{suffix}"
+    entity_descriptions_file = dataset_path / f"entity_id2description.{suffix}"
+    relation_names_file = dataset_path / f"relation_id2name.{suffix}"
     
     # Check that all files exist
     missing_files = []
-    for file_path, file_desc in [
-        (entity_names_file, "entity_id2name.json"),
-        (entity_descriptions_file, "entity_id2description.json"), 
-        (relation_names_file, "relation_id2name.json")
-    ]:
+    for file_path in [entity_names_file, entity_descriptions_file, relation_names_file]:
         if not file_path.exists():
-            missing_files.append(file_desc)
+            missing_files.append(file_path.name)
     
     if missing_files:
         raise FileNotFoundError(
@@ -142,7 +588,7 @@ def load_standardized_kg(dataset_dir: str) -> Dict[str, Dict[str, str]]:
     
     # Load all files
     return {
-        'entities': load_json(entity_names_file),
-        'descriptions': load_json(entity_descriptions_file),
-        'relations': load_json(relation_names_file)
+        'entities': _load_mapping_copy(entity_names_file),
+        'descriptions': _load_mapping_copy(entity_descriptions_file),
+        'relations': _load_mapping_copy(relation_names_file)
     }
@@ -1,34 +1,79 @@
 """Text processing utilities for knowledge graph data."""
 
-from typing import Dict, Optional, Tuple
-from .truncation import truncate_descriptions
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+from .truncation import truncate_descriptions, truncate_text_by_words, get_truncation_limit
+
+# Below this many descriptions truncation always runs in-process, even when
+# workers are requested: the pickling round trip costs more than it saves.
+PARALLEL_TRUNCATION_THRESHOLD = 200_000
+
+# Number of processed triplet lines buffered before each write.
+TRIPLET_WRITE_BATCH_SIZE = 8192
 
 
 def fill_missing_entity_entries(
     entity_id2name: Dict[str, str],
-    entity_id2description: Dict[str, str]
+    entity_id2description: Dict[str, str],
+    placeholder: str = '',
+    inplace: bool = False
 ) -> Tuple[Dict[str, str], Dict[str, str]]:
     """Fill missing entries between entity name and description mappings.
     
+    Only the IDs present in one mapping but not the other are touched, so the
+    cost scales with the size of the difference rather than the whole mapping.
+    
     Args:
         entity_id2name: Entity ID to name mapping
         entity_id2description: Entity ID to description mapping
+        placeholder: Value used for missing entries (default: empty string)
+        inplace: Fill the given mappings directly instead of copies; saves
+            copying both mappings when the caller no longer needs the originals
         
     Returns:
         Tuple of (filled_names, filled_descriptions) with missing entries filled
     """
-    all_entity_ids = set(entity_id2name.keys()) | set(entity_id2description.keys())
+    if inplace:
+        filled_names = entity_id2name
+        filled_descriptions = entity_id2description
+    else:
+        filled_names = dict(entity_id2name)
+        filled_descriptions = dict(entity_id2description)
     
-    filled_names = {}
-    filled_descriptions = {}
+    only_in_names = entity_id2name.keys() - entity_id2description.keys()
+    only_in_descriptions = entity_id2description.keys() - entity_id2name.keys()
     
-    for entity_id in all_entity_ids:
-        filled_names[entity_id] = entity_id2name.get(entity_id, '')
-        filled_descriptions[entity_id] = entity_id2description.get(entity_id, '')
+    filled_descriptions.update(dict.fromkeys(only_in_names, placeholder))
+    filled_names.update(dict.fromkeys(only_in_descriptions, placeholder))
     
     return filled_names, filled_descriptions
 
 
+def create_entity_ids(
+    entity_id2name: Dict[str, str],
+    entity_id2description: Dict[str, str]
+) -> List[str]:
+    """Create a sorted list of all entity IDs from name and description mappings.
+    
+    Args:
+        entity_id2name: Entity ID to name mapping
+        entity_id2description: Entity ID to description mapping
+        
+    Returns:
+        Sorted list of all unique entity IDs
+    """
+    # Extend the name IDs with the description-only IDs and sort in place,
+    # so no intermediate set of all IDs is built
+    entity_ids = list(entity_id2name)
+    entity_ids.extend(
+        entity_id for entity_id in entity_id2description if entity_id not in entity_id2name
+    )
+    entity_ids.sort()
+    return entity_ids
+
+
 def validate_entity_mappings(
     entity_id2name: Dict[str, str],
     entity_id2description: Dict[str, str]
@@ -58,7 +103,8 @@ def truncate_entity_descriptions(
     descriptions: Dict[str, str], 
     max_words: int = 50,
     dataset: Optional[str] = None,
-    content_type: Optional[str] = None
+    content_type: Optional[str] = None,
+    workers: int = 1
 ) -> Dict[str, str]:
     """Truncate entity/relation descriptions using word-based truncation.
     
@@ -66,19 +112,56 @@ def truncate_entity_descriptions(
     text is split by whitespace and only the first max_words words are kept.
     
     This is a backward-compatible wrapper around the new truncation module.
+    With workers > 1, inputs larger than PARALLEL_TRUNCATION_THRESHOLD are
+    split into chunks and truncated across that many worker processes, which
+    gives the same result. Every chunk is pickled to a worker and back, so
+    this only pays off with several idle CPUs.
     
     Args:
         descriptions: Dictionary mapping IDs to text descriptions
         max_words: Maximum number of words to keep (default: 50)
         dataset: Dataset name for dataset-aware truncation ('wn18rr', 'fb15k237', 'wikidata5m')
         content_type: Type of content ('entity' or 'relation') for dataset-aware truncation
+        workers: Number of worker processes to truncate with (default: 1,
+            truncate in this process)
         
     Returns:
         Dictionary with truncated descriptions
     """
+    if workers > 1 and len(descriptions) > PARALLEL_TRUNCATION_THRESHOLD:
+        return _truncate_descriptions_parallel(
+            descriptions, get_truncation_limit(dataset, content_type, max_words), workers
+        )
     return truncate_descriptions(descriptions, max_words, dataset, content_type)
 
 
+def _truncate_chunk(items: List[Tuple[str, str]], max_words: int) -> Dict[str, str]:
+    """Word-truncate a chunk of (id, description) pairs in a worker process."""
+    return {
+        item_id: truncate_text_by_words(description, max_words) if description else ''
+        for item_id, description in items
+    }
+
+
+def _truncate_descriptions_parallel(
+    descriptions: Dict[str, str],
+    max_words: int,
+    n_workers: int
+) -> Dict[str, str]:
+    """Word-truncate a large description mapping across worker processes."""
+    # Several chunks per worker keeps the pool balanced when description
+    # lengths vary between chunks.
+    chunk_size = max(1, len(descriptions) // (n_workers * 4))
+    items = iter(descriptions.items())
+    chunks = iter(lambda: list(islice(items, chunk_size)), [])
+    
+    truncated = {}
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for chunk_result in executor.map(partial(_truncate_chunk, max_words=max_words), chunks):
+            truncated.update(chunk_result)
+    return truncated
+
+
 def clean_wn18rr_entity_name(entity_name: str) -> str:
     """Clean WN18RR entity names by removing __ prefix.
     
@@ -109,23 +192,33 @@ def preprocess_triplet_data(
         output_file: Path to output processed file
         dataset: Dataset name for appropriate processing
     """
-    with open(triplets_file, 'r', encoding='utf-8') as infile, \
-         open(output_file, 'w', encoding='utf-8') as outfile:
+    if dataset.lower() == 'wn18rr':
+        # Entities recur across many triplets, so clean each description once
+        entity_descriptions = {
+            entity_id: clean_wn18rr_entity_name(description)
+            for entity_id, description in entity_descriptions.items()
+        }
+    get_entity_desc = entity_descriptions.get
+    get_relation_desc = relation_descriptions.get
+    
+    with open(triplets_file, 'r', encoding='utf-8', buffering=1 << 20) as infile, \
+         open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as outfile:
         
+        # Output lines are collected and written in batches
+        batch = []
         for line in infile:
-            parts = line.strip().split('\t')
+            parts = line.strip().split('\t', 3)
             if len(parts) >= 3:
                 head, relation, tail = parts[:3]
                 
                 # Get descriptions (use empty string if not found)
-                head_desc = entity_descriptions.get(head, '')
-                tail_desc = entity_descriptions.get(tail, '')
-                rel_desc = relation_descriptions.get(relation, '')
-                
-                # Apply dataset-specific cleaning
-                if dataset.lower() == 'wn18rr':
-                    head_desc = clean_wn18rr_entity_name(head_desc)
-                    tail_desc = clean_wn18rr_entity_name(tail_desc)
+                head_desc = get_entity_desc(head, '')
+                tail_desc = get_entity_desc(tail, '')
+                rel_desc = get_relation_desc(relation, '')
                 
                 # Write processed triplet with descriptions
-                outfile.write(f"{head}\t{relation}\t{tail}\t{head_desc}\t{rel_desc}\t{tail_desc}\n")
+                batch.append('\t'.join((head, relation, tail, head_desc, rel_desc, tail_desc)) + '\n')
+                if len(batch) >= TRIPLET_WRITE_BATCH_SIZE:
+                    outfile.writelines(batch)
+                    batch.clear()
+        outfile.writelines(batch)
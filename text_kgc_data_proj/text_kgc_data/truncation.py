@@ -4,6 +4,7 @@ This module provides reusable truncation functions that can be used across
 different datasets and content types.
 """
 
+import sys
 from typing import Dict, Optional, Union
 
 import tqdm
@@ -25,6 +26,10 @@ TRUNCATION_CONFIGS = {
     }
 }
 
+# Items between progress bar refreshes; the per-item work is a single split,
+# so refreshing less often keeps tqdm's bookkeeping out of the loop
+PROGRESS_MINITERS = 1 << 16
+
 
 def get_truncation_limit(
     dataset: Optional[str] = None,
@@ -76,8 +81,10 @@ def truncate_text_by_words(
     if not text or not text.strip():
         return '' if preserve_empty else text
     
-    # Word-based truncation: split by whitespace and take first max_words words
-    words = text.split()
+    # Word-based truncation: split by whitespace and take first max_words words.
+    # maxsplit stops scanning after max_words words, leaving the rest of a long
+    # description as a single trailing element that the slice drops.
+    words = text.split(None, max_words)
     return ' '.join(words[:max_words])
 
 
@@ -101,16 +108,24 @@ def truncate_descriptions(
     Returns:
         Dictionary with truncated descriptions
     """
+    dataset = sys.intern(dataset) if dataset else None
+    content_type = sys.intern(content_type) if content_type else None
+    
     # Get dataset-aware truncation limit
     effective_limit = get_truncation_limit(dataset, content_type, max_words)
     
-    truncated = {}
-    for item_id, description in tqdm.tqdm(descriptions.items(), desc="Truncating descriptions"):
-        truncated[item_id] = truncate_text_by_words(
-            description, 
-            effective_limit,
-            preserve_empty=True
-        )
+    # dict.fromkeys sizes the result table once up front and already holds ''
+    # for empty descriptions, so those skip the truncation entirely
+    truncated = dict.fromkeys(descriptions, '')
+    join = ' '.join
+    for item_id, description in tqdm.tqdm(
+        descriptions.items(), desc="Truncating descriptions", total=len(descriptions),
+        miniters=PROGRESS_MINITERS
+    ):
+        if description:
+            # Inlined truncate_text_by_words; whitespace-only text splits to
+            # no words and joins to '' as there
+            truncated[item_id] = join(description.split(None, effective_limit)[:effective_limit])
     
     return truncated
 
@@ -129,7 +144,7 @@ def add_truncation_config(
         entity_limit: Word limit for entity descriptions
         relation_limit: Word limit for relation descriptions
     """
-    TRUNCATION_CONFIGS[dataset.lower()] = {
+    TRUNCATION_CONFIGS[sys.intern(dataset.lower())] = {
         'entity': entity_limit,
         'relation': relation_limit
     }